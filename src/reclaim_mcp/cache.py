@@ -1,5 +1,7 @@
 """Simple TTL cache for read-only API responses."""
 
+import asyncio
+import inspect
 import time
 from functools import wraps
 from typing import Any, Callable, TypeVar
@@ -7,18 +9,36 @@ from typing import Any, Callable, TypeVar
 # Simple in-memory cache with TTL
 _cache: dict[str, tuple[float, Any]] = {}
 
+# In-flight fetches by cache key, so concurrent misses share one upstream call
+_inflight: dict[str, asyncio.Task[Any]] = {}
+
 # Default TTL in seconds
 DEFAULT_TTL = 60
 
+# Cached reads of the user's schedule. Anything that moves or reschedules a
+# calendar block (tasks, habits, events, focus blocks) must drop all of them.
+SCHEDULE_CACHES = ("list_events", "list_personal_events", "get_current_moment", "get_next_moment")
+
 # Type variable for async functions
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def ttl_cache(ttl: int = DEFAULT_TTL) -> Callable[[F], F]:
+def ttl_cache(ttl: int | Callable[..., int] = DEFAULT_TTL, stale_ttl: int = 0) -> Callable[[F], F]:
     """Decorator for caching async function results with TTL.
 
+    Concurrent calls with the same arguments that miss the cache are coalesced:
+    the first caller starts the fetch and the others await the same result.
+
+    With stale_ttl set, an entry that expired less than stale_ttl seconds ago is
+    still returned immediately while a background fetch refreshes it
+    (stale-while-revalidate). Invalidated entries are never served stale.
+
     Args:
-        ttl: Time-to-live in seconds (default 60)
+        ttl: Time-to-live in seconds (default 60), or a function called with the
+            same arguments as the decorated function that returns one, for
+            TTLs that depend on the request (e.g. longer for past date ranges)
+        stale_ttl: Seconds past expiry during which a stale value may be served
+            while refreshing (default 0, disabled)
 
     Returns:
         Decorated function with caching.
@@ -30,48 +50,175 @@ def ttl_cache(ttl: int = DEFAULT_TTL) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        def cache_key_for(*args: Any, **kwargs: Any) -> str:
+            # Bind to the signature so positional, keyword and defaulted calls share one entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return f"{func.__name__}:{bound.arguments}"
+
+        def ttl_for(*args: Any, **kwargs: Any) -> int:
+            return ttl(*args, **kwargs) if callable(ttl) else ttl
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Build cache key from function name and arguments
-            cache_key = f"{func.__name__}:{args}:{sorted(kwargs.items())}"
-            now = time.time()
+            cache_key = cache_key_for(*args, **kwargs)
 
             # Check cache hit
             if cache_key in _cache:
                 expires, value = _cache[cache_key]
+                now = time.monotonic()
                 if now < expires:
                     return value
+                if now < expires + stale_ttl:
+                    # Serve stale, refresh in the background
+                    _start_fetch(cache_key, args, kwargs)
+                    return value
+
+            # Cache miss - join an in-flight fetch or start a new one.
+            # Shield so one cancelled caller doesn't cancel the fetch for the others
+            return await asyncio.shield(_start_fetch(cache_key, args, kwargs))
 
-            # Cache miss - call function and store result
+        def _start_fetch(cache_key: str, args: tuple, kwargs: dict) -> "asyncio.Task[Any]":
+            task = _inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(_fetch(cache_key, args, kwargs))
+                _inflight[cache_key] = task
+                task.add_done_callback(lambda t: _discard_inflight(cache_key, t))
+            return task
+
+        async def _fetch(cache_key: str, args: tuple, kwargs: dict) -> Any:
             result = await func(*args, **kwargs)
 
-            # Only cache successful results (not error strings)
+            # Only cache successful results (not error strings), and skip results
+            # whose fetch was invalidated by a mutation while it was in flight
             if not isinstance(result, str) or not result.startswith("Error"):
-                _cache[cache_key] = (now + ttl, result)
+                if _inflight.get(cache_key) is asyncio.current_task():
+                    _cache[cache_key] = (time.monotonic() + ttl_for(*args, **kwargs), result)
 
             return result
 
+        wrapper.cache_key = cache_key_for  # type: ignore[attr-defined]
+        wrapper.cache_ttl = ttl_for  # type: ignore[attr-defined]
         return wrapper  # type: ignore
 
     return decorator
 
 
-def invalidate_cache(prefix: str | None = None) -> None:
+def _discard_inflight(cache_key: str, task: "asyncio.Task[Any]") -> None:
+    """Drop a finished fetch from the in-flight table unless it was already replaced."""
+    if _inflight.get(cache_key) is task:
+        del _inflight[cache_key]
+    # Mark a failure as retrieved; background refreshes have no awaiting caller
+    if not task.cancelled():
+        task.exception()
+
+
+def invalidate_cache(*prefixes: str) -> None:
     """Invalidate cache entries, optionally by prefix.
 
+    In-flight fetches for matching keys are detached, so later callers start a
+    fresh request instead of joining one that may predate the mutation.
+
     Args:
-        prefix: If provided, only invalidate entries starting with this prefix.
-                If None, clears the entire cache.
+        *prefixes: If provided, only invalidate entries starting with any of these
+                prefixes (in a single pass). If omitted, clears the entire cache.
 
     Example:
         invalidate_cache("list_habits")  # Clear habit list cache
+        invalidate_cache("list_tasks", "list_events")  # Clear several at once
         invalidate_cache()  # Clear all cache
     """
-    global _cache
-    if prefix:
-        _cache = {k: v for k, v in _cache.items() if not k.startswith(prefix)}
+    global _cache, _inflight
+    if prefixes:
+        _cache = {k: v for k, v in _cache.items() if not k.startswith(prefixes)}
+        _inflight = {k: v for k, v in _inflight.items() if not k.startswith(prefixes)}
     else:
         _cache.clear()
+        _inflight.clear()
+
+
+def invalidate_entry(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Invalidate the cached result of one call to a @ttl_cache function.
+
+    Unlike invalidate_cache, other cached calls of the same function are kept.
+
+    Args:
+        func: The @ttl_cache decorated function.
+        *args: Positional arguments of the call to invalidate.
+        **kwargs: Keyword arguments of the call to invalidate.
+
+    Example:
+        invalidate_entry(get_habit, lineage_id)  # Only this habit's entry
+    """
+    cache_key = func.cache_key(*args, **kwargs)  # type: ignore[attr-defined]
+    _cache.pop(cache_key, None)
+    _inflight.pop(cache_key, None)
+
+
+def is_live_fetch(func: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+    """Check whether the running task is the live in-flight fetch for one call.
+
+    A fetch detached by invalidate_cache (or invalidate_entry / update_cached)
+    while it was in flight is no longer live; its result is not cached, and
+    anything derived from it should not be cached either.
+
+    Args:
+        func: The @ttl_cache decorated function.
+        *args: Positional arguments of the call.
+        **kwargs: Keyword arguments of the call.
+
+    Example:
+        if is_live_fetch(list_habits):  # Inside list_habits' body
+            prime_entry(get_habit, habit, habit["lineageId"])
+    """
+    cache_key = func.cache_key(*args, **kwargs)  # type: ignore[attr-defined]
+    return _inflight.get(cache_key) is asyncio.current_task()
+
+
+def prime_entry(func: Callable[..., Any], value: Any, *args: Any, **kwargs: Any) -> None:
+    """Cache a value for one call to a @ttl_cache function without calling it.
+
+    Used when another read already returned the same data, so a follow-up call
+    is served from the cache. The entry gets the function's usual TTL. When
+    priming from inside a cached fetch, check is_live_fetch first so data from
+    a fetch that a mutation invalidated is not cached.
+
+    Args:
+        func: The @ttl_cache decorated function.
+        value: The result to cache for this call.
+        *args: Positional arguments of the call.
+        **kwargs: Keyword arguments of the call.
+
+    Example:
+        prime_entry(get_habit, habit, habit["lineageId"])  # Warm from list_habits
+    """
+    cache_key = func.cache_key(*args, **kwargs)  # type: ignore[attr-defined]
+    _cache[cache_key] = (time.monotonic() + func.cache_ttl(*args, **kwargs), value)  # type: ignore[attr-defined]
+
+
+def update_cached(prefix: str, update: Callable[[Any], Any]) -> None:
+    """Rewrite cached values in place after a write (write-through).
+
+    Each entry whose key starts with prefix is replaced by update(value) and
+    keeps its original expiry. In-flight fetches for those keys are detached,
+    as in invalidate_cache, so a read that started before the write cannot
+    overwrite the updated value.
+
+    Args:
+        prefix: Cache key prefix (usually the cached function's name).
+        update: Function mapping the old cached value to the new one.
+
+    Example:
+        update_cached("get_focus_settings", lambda settings: [...])
+    """
+    global _inflight
+    for key, (expires, value) in list(_cache.items()):
+        if key.startswith(prefix):
+            _cache[key] = (expires, update(value))
+    _inflight = {k: v for k, v in _inflight.items() if not k.startswith(prefix)}
 
 
 def get_cache_stats() -> dict[str, Any]:
@@ -80,10 +227,11 @@ def get_cache_stats() -> dict[str, Any]:
     Returns:
         Dict with cache size and entry info.
     """
-    now = time.time()
+    now = time.monotonic()
     valid_entries = sum(1 for _, (expires, _) in _cache.items() if expires > now)
     return {
         "total_entries": len(_cache),
         "valid_entries": valid_entries,
         "expired_entries": len(_cache) - valid_entries,
+        "inflight_requests": len(_inflight),
     }
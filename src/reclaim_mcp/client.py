@@ -1,27 +1,138 @@
 """Async HTTP client for Reclaim.ai API."""
 
+import asyncio
+import importlib.util
 import json
-from typing import Any
+import random
+import time
+from typing import Any, Awaitable, Callable
 
 import httpx
 
-from reclaim_mcp.config import Settings
+from reclaim_mcp.config import Settings, get_settings
 from reclaim_mcp.exceptions import APIError, NotFoundError, RateLimitError
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, not a required dependency
+    orjson = None  # type: ignore[assignment]
+
+# HTTP/2 multiplexing needs the optional h2 package (speedups extra)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _encode_json(data: Any) -> bytes:
+    """Encode a request body as compact UTF-8 JSON, using orjson when installed.
+
+    The fallback matches what httpx's json= argument sends.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Parse a JSON response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class ReclaimClient:
     """Async client for interacting with the Reclaim.ai API."""
 
     # Timeout for API requests (30s to handle slow endpoints like /api/events/personal)
     REQUEST_TIMEOUT = 30.0
+    CONNECT_TIMEOUT = 5.0
+
+    # Connection pool sizing (httpx defaults to 10 connections / 20 keep-alive)
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 50
+    KEEPALIVE_EXPIRY = 30.0
+
+    # Upper bound on concurrent upstream requests; bursts queue here instead of
+    # piling onto the pool (and into Reclaim's rate limiter)
+    MAX_CONCURRENT_REQUESTS = 32
+
+    # Retries after a 429: wait Retry-After if the API sends one, otherwise back
+    # off exponentially with jitter. Longer waits are reported to the caller.
+    RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_BACKOFF = 0.5
+    RATE_LIMIT_MAX_WAIT = 8.0
 
     def __init__(self, settings: Settings) -> None:
-        """Initialize the client with settings."""
+        """Initialize the client with settings.
+
+        A single httpx.AsyncClient is created per ReclaimClient so that TCP/TLS
+        connections are pooled and reused across requests.
+        """
         self.base_url = settings.base_url
         self.headers = {
             "Authorization": f"Bearer {settings.api_key}",
             "Content-Type": "application/json",
         }
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=httpx.Timeout(self.REQUEST_TIMEOUT, connect=self.CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
+            http2=_HTTP2_AVAILABLE,
+        )
+        self._admit = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._backoff_until = 0.0
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Seconds to wait before retrying a rate-limited request.
+
+        Args:
+            response: The 429 response
+            attempt: Number of retries already made
+
+        Returns:
+            The delay, or None if the request should not be retried.
+        """
+        if attempt >= self.RATE_LIMIT_RETRIES:
+            return None
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):  # Missing, or an HTTP date
+            delay = self.RATE_LIMIT_BACKOFF * 2**attempt + random.uniform(0, self.RATE_LIMIT_BACKOFF)
+        return delay if delay <= self.RATE_LIMIT_MAX_WAIT else None
+
+    async def _send(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send a request through the admission semaphore, retrying on 429.
+
+        The rate limit is per API key, so a 429 holds back every request on
+        this client until the backoff window has passed, not just the retry.
+
+        Args:
+            send: Issues the request on the shared httpx client.
+
+        Returns:
+            The final response (a 429 if retries ran out).
+        """
+        attempt = 0
+        while True:
+            wait = self._backoff_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with self._admit:
+                response = await send()
+            if response.status_code != 429:
+                return response
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            self._backoff_until = max(self._backoff_until, time.monotonic() + delay)
+            attempt += 1
 
     def _parse_error_message(self, response: httpx.Response) -> str:
         """Parse error message from API response.
@@ -80,8 +191,11 @@ class ReclaimClient:
             APIError: For other 4xx/5xx errors
         """
         if response.status_code == 429:
-            retry_after = response.headers.get("Retry-After", "60")
-            raise RateLimitError(f"Rate limit exceeded. Wait {retry_after}s before retrying.")
+            retry_after = response.headers.get("Retry-After")
+            raise RateLimitError(
+                f"Rate limit exceeded. Wait {retry_after or 60}s before retrying.",
+                retry_after=float(retry_after) if retry_after is not None and retry_after.isdigit() else None,
+            )
         if response.status_code == 404:
             raise NotFoundError(f"Resource not found: {endpoint}")
         if response.status_code == 401:
@@ -98,14 +212,9 @@ class ReclaimClient:
 
     async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
         """Make a GET request to the API."""
-        async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-            response = await client.get(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                params=params,
-            )
-            self._handle_response_errors(response, endpoint)
-            return response.json()
+        response = await self._send(lambda: self._http.get(endpoint, params=params))
+        self._handle_response_errors(response, endpoint)
+        return _decode_json(response)
 
     async def post(
         self,
@@ -114,18 +223,13 @@ class ReclaimClient:
         params: dict[str, Any] | None = None,
     ) -> Any:
         """Make a POST request to the API."""
-        async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                json=data,
-                params=params,
-            )
-            self._handle_response_errors(response, endpoint)
-            # Handle empty response bodies (some endpoints return no content)
-            if not response.content:
-                return {}
-            return response.json()
+        content = _encode_json(data)
+        response = await self._send(lambda: self._http.post(endpoint, content=content, params=params))
+        self._handle_response_errors(response, endpoint)
+        # Handle empty response bodies (some endpoints return no content)
+        if not response.content:
+            return {}
+        return _decode_json(response)
 
     async def put(
         self,
@@ -134,28 +238,19 @@ class ReclaimClient:
         params: dict[str, Any] | None = None,
     ) -> Any:
         """Make a PUT request to the API."""
-        async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-            response = await client.put(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                json=data,
-                params=params,
-            )
-            self._handle_response_errors(response, endpoint)
-            if not response.content:
-                return {}
-            return response.json()
+        content = _encode_json(data)
+        response = await self._send(lambda: self._http.put(endpoint, content=content, params=params))
+        self._handle_response_errors(response, endpoint)
+        if not response.content:
+            return {}
+        return _decode_json(response)
 
     async def patch(self, endpoint: str, data: dict[str, Any]) -> Any:
         """Make a PATCH request to the API."""
-        async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-            response = await client.patch(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                json=data,
-            )
-            self._handle_response_errors(response, endpoint)
-            return response.json()
+        content = _encode_json(data)
+        response = await self._send(lambda: self._http.patch(endpoint, content=content))
+        self._handle_response_errors(response, endpoint)
+        return _decode_json(response)
 
     async def delete(self, endpoint: str) -> bool:
         """Make a DELETE request to the API.
@@ -168,10 +263,29 @@ class ReclaimClient:
             RateLimitError: If rate limit exceeded (429).
             APIError: For other errors.
         """
-        async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-            response = await client.delete(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-            )
-            self._handle_response_errors(response, endpoint)
-            return response.status_code in (200, 204)
+        response = await self._send(lambda: self._http.delete(endpoint))
+        self._handle_response_errors(response, endpoint)
+        return response.status_code in (200, 204)
+
+
+_shared_client: ReclaimClient | None = None
+
+
+def get_client() -> ReclaimClient:
+    """Get the shared Reclaim client, creating it on first use.
+
+    All tools share one client (and therefore one connection pool) for the
+    lifetime of the server process.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = ReclaimClient(get_settings())
+    return _shared_client
+
+
+async def close_client() -> None:
+    """Close the shared Reclaim client, if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        await client.aclose()
@@ -14,9 +14,15 @@ class NotFoundError(ReclaimError):
 
 
 class RateLimitError(ReclaimError):
-    """Rate limit exceeded (429)."""
+    """Rate limit exceeded (429).
 
-    pass
+    Attributes:
+        retry_after: Seconds the API asked to wait, if it said.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class APIError(ReclaimError):
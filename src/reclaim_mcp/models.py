@@ -123,12 +123,18 @@ class Task(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+# Input formats, compiled once and shared by the validators below
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_ISO_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:\d{2})?$")
+_TIME_RE = re.compile(r"^\d{2}:\d{2}(:\d{2})?$")
+
+
 def _validate_date_format(v: Optional[str]) -> Optional[str]:
     """Validate date is in YYYY-MM-DD format."""
     if v is None:
         return v
     # Accept YYYY-MM-DD format
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", v):
+    if not _DATE_RE.match(v):
         raise ValueError("date must be in YYYY-MM-DD format (e.g., '2026-01-15')")
     # Validate actual date values
     try:
@@ -140,14 +146,18 @@ def _validate_date_format(v: Optional[str]) -> Optional[str]:
 
 
 class TaskCreate(BaseModel):
-    """Request model for creating a task with validation."""
+    """Request model for creating a task with validation.
+
+    Serialization aliases are the Reclaim POST /api/tasks field names;
+    duration_minutes and max_chunk_size_minutes are derived fields in the body.
+    """
 
     title: str
     duration_minutes: int = Field(gt=0)
-    min_chunk_size_minutes: int = Field(default=15, gt=0)
+    min_chunk_size_minutes: int = Field(default=15, gt=0, serialization_alias="minChunkSize")
     max_chunk_size_minutes: Optional[int] = Field(default=None, gt=0)
-    due_date: Optional[str] = None
-    snooze_until: Optional[str] = None
+    due_date: Optional[str] = Field(default=None, serialization_alias="deadline")
+    snooze_until: Optional[str] = Field(default=None, serialization_alias="snoozeUntil")
     priority: TaskPriority = TaskPriority.P2
 
     @field_validator("title")
@@ -183,17 +193,22 @@ class TaskCreate(BaseModel):
 
 
 class TaskUpdate(BaseModel):
-    """Request model for updating a task with validation."""
+    """Request model for updating a task with validation.
+
+    Serialization aliases are the Reclaim API field names, so
+    ``model_dump(by_alias=True, exclude_none=True)`` yields the PATCH body for
+    every field that maps 1:1 (duration_minutes and due_date need converting).
+    """
 
     title: Optional[str] = None
     duration_minutes: Optional[int] = Field(default=None)
     status: Optional[TaskStatus] = None
     due_date: Optional[str] = None
     priority: Optional[TaskPriority] = None
-    snooze_until: Optional[str] = None
+    snooze_until: Optional[str] = Field(default=None, serialization_alias="snoozeUntil")
     notes: Optional[str] = None
-    min_chunk_size_minutes: Optional[int] = Field(default=None)
-    max_chunk_size_minutes: Optional[int] = Field(default=None)
+    min_chunk_size_minutes: Optional[int] = Field(default=None, serialization_alias="minChunkSize")
+    max_chunk_size_minutes: Optional[int] = Field(default=None, serialization_alias="maxChunkSize")
 
     @field_validator("duration_minutes", "min_chunk_size_minutes", "max_chunk_size_minutes")
     @classmethod
@@ -247,8 +262,7 @@ class PlanWork(BaseModel):
     @classmethod
     def validate_datetime_format(cls, v: str) -> str:
         """Validate date_time is in ISO format."""
-        iso_pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:\d{2})?$"
-        if not re.match(iso_pattern, v):
+        if not _ISO_DATETIME_RE.match(v):
             raise ValueError("date_time must be in ISO format (e.g., '2026-01-02T14:00:00Z')")
         return v
 
@@ -282,8 +296,8 @@ class HabitCreate(BaseModel):
     @field_validator("ideal_time")
     @classmethod
     def validate_ideal_time(cls, v: str) -> str:
-        """Validate ideal_time is in HH:MM or HH:MM:SS format."""
-        if not re.match(r"^\d{2}:\d{2}(:\d{2})?$", v):
+        """Validate ideal_time is in HH:MM or HH:MM:SS format and normalize it to HH:MM:SS."""
+        if not _TIME_RE.match(v):
             raise ValueError("ideal_time must be in HH:MM or HH:MM:SS format (e.g., '09:00')")
         parts = v.split(":")
         hour, minute = int(parts[0]), int(parts[1])
@@ -291,7 +305,7 @@ class HabitCreate(BaseModel):
             raise ValueError("hour must be between 00 and 23")
         if not (0 <= minute <= 59):
             raise ValueError("minute must be between 00 and 59")
-        return v
+        return v if len(v) == 8 else v + ":00"
 
     @model_validator(mode="after")
     def validate_habit_constraints(self) -> "HabitCreate":
@@ -309,17 +323,21 @@ class HabitCreate(BaseModel):
 
 
 class HabitUpdate(BaseModel):
-    """Validation model for updating a habit."""
+    """Validation model for updating a habit.
+
+    Serialization aliases are the Reclaim API field names; the recurrence
+    fields (frequency, ideal_days) need reshaping before sending.
+    """
 
     title: Optional[str] = None
-    ideal_time: Optional[str] = None
-    duration_min_mins: Optional[int] = Field(default=None)
-    duration_max_mins: Optional[int] = Field(default=None)
+    ideal_time: Optional[str] = Field(default=None, serialization_alias="idealTime")
+    duration_min_mins: Optional[int] = Field(default=None, serialization_alias="durationMinMins")
+    duration_max_mins: Optional[int] = Field(default=None, serialization_alias="durationMaxMins")
     enabled: Optional[bool] = None
     frequency: Optional[HabitFrequency] = None
     ideal_days: Optional[list[DayOfWeek]] = None
-    event_type: Optional[EventType] = None
-    defense_aggression: Optional[DefenseAggression] = None
+    event_type: Optional[EventType] = Field(default=None, serialization_alias="eventType")
+    defense_aggression: Optional[DefenseAggression] = Field(default=None, serialization_alias="defenseAggression")
     description: Optional[str] = None
 
     @field_validator("duration_min_mins", "duration_max_mins")
@@ -333,10 +351,10 @@ class HabitUpdate(BaseModel):
     @field_validator("ideal_time")
     @classmethod
     def validate_ideal_time(cls, v: Optional[str]) -> Optional[str]:
-        """Validate ideal_time is in HH:MM or HH:MM:SS format."""
+        """Validate ideal_time is in HH:MM or HH:MM:SS format and normalize it to HH:MM:SS."""
         if v is None:
             return v
-        if not re.match(r"^\d{2}:\d{2}(:\d{2})?$", v):
+        if not _TIME_RE.match(v):
             raise ValueError("ideal_time must be in HH:MM or HH:MM:SS format (e.g., '09:00')")
         parts = v.split(":")
         hour, minute = int(parts[0]), int(parts[1])
@@ -344,7 +362,7 @@ class HabitUpdate(BaseModel):
             raise ValueError("hour must be between 00 and 23")
         if not (0 <= minute <= 59):
             raise ValueError("minute must be between 00 and 59")
-        return v
+        return v if len(v) == 8 else v + ":00"
 
     @model_validator(mode="after")
     def validate_update_constraints(self) -> "HabitUpdate":
@@ -387,8 +405,7 @@ class EventMove(BaseModel):
     def validate_datetime_format(cls, v: str) -> str:
         """Validate datetime is in ISO format."""
         # Accept ISO 8601 formats: 2026-01-02T14:00:00Z or 2026-01-02T14:00:00+00:00
-        iso_pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:\d{2})?$"
-        if not re.match(iso_pattern, v):
+        if not _ISO_DATETIME_RE.match(v):
             raise ValueError("datetime must be in ISO format (e.g., '2026-01-02T14:00:00Z')")
         return v
 
@@ -422,12 +439,16 @@ class TimeLog(BaseModel):
 
 
 class FocusSettingsUpdate(BaseModel):
-    """Validation model for updating focus settings."""
+    """Validation model for updating focus settings.
+
+    Serialization aliases are the Reclaim API field names, so the PATCH body is
+    ``model_dump(mode="json", by_alias=True, exclude_none=True)``.
+    """
 
-    min_duration_mins: Optional[int] = Field(default=None)
-    ideal_duration_mins: Optional[int] = Field(default=None)
-    max_duration_mins: Optional[int] = Field(default=None)
-    defense_aggression: Optional[DefenseAggression] = None
+    min_duration_mins: Optional[int] = Field(default=None, serialization_alias="minDurationMins")
+    ideal_duration_mins: Optional[int] = Field(default=None, serialization_alias="idealDurationMins")
+    max_duration_mins: Optional[int] = Field(default=None, serialization_alias="maxDurationMins")
+    defense_aggression: Optional[DefenseAggression] = Field(default=None, serialization_alias="defenseAggression")
     enabled: Optional[bool] = None
 
     @field_validator("min_duration_mins", "ideal_duration_mins", "max_duration_mins")
@@ -460,8 +481,8 @@ class FocusReschedule(BaseModel):
 
     calendar_id: int = Field(gt=0)
     event_id: str = Field(min_length=1)
-    start_time: Optional[str] = None
-    end_time: Optional[str] = None
+    start_time: Optional[str] = Field(default=None, serialization_alias="start")
+    end_time: Optional[str] = Field(default=None, serialization_alias="end")
 
     @field_validator("start_time", "end_time")
     @classmethod
@@ -469,8 +490,7 @@ class FocusReschedule(BaseModel):
         """Validate datetime is in ISO format."""
         if v is None:
             return v
-        iso_pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:\d{2})?$"
-        if not re.match(iso_pattern, v):
+        if not _ISO_DATETIME_RE.match(v):
             raise ValueError("datetime must be in ISO format (e.g., '2026-01-02T14:00:00Z')")
         return v
 
@@ -490,6 +510,58 @@ class HabitId(BaseModel):
     lineage_id: int = Field(gt=0)
 
 
+class HabitBatchAction(str, Enum):
+    """Actions supported by batch_habits."""
+
+    # Habit instance actions (take event_id)
+    MARK_DONE = "mark_done"
+    SKIP = "skip"
+    LOCK = "lock"
+    UNLOCK = "unlock"
+    # Habit series actions (take lineage_id)
+    GET = "get"
+    START = "start"
+    STOP = "stop"
+    ENABLE = "enable"
+    DISABLE = "disable"
+
+
+_HABIT_INSTANCE_ACTIONS = frozenset(
+    {HabitBatchAction.MARK_DONE, HabitBatchAction.SKIP, HabitBatchAction.LOCK, HabitBatchAction.UNLOCK}
+)
+
+
+class HabitBatchOperation(BaseModel):
+    """Validation for a single batch_habits operation."""
+
+    action: HabitBatchAction
+    event_id: Optional[str] = Field(default=None, min_length=1)
+    lineage_id: Optional[int] = Field(default=None, gt=0)
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "HabitBatchOperation":
+        """Validate the operation carries the ID its action needs."""
+        if self.action in _HABIT_INSTANCE_ACTIONS:
+            if self.event_id is None:
+                raise ValueError(f"{self.action.value} requires event_id")
+        elif self.lineage_id is None:
+            raise ValueError(f"{self.action.value} requires lineage_id")
+        return self
+
+    @property
+    def target(self) -> str | int:
+        """The event ID or lineage ID this operation acts on."""
+        if self.action in _HABIT_INSTANCE_ACTIONS:
+            return cast(str, self.event_id)
+        return cast(int, self.lineage_id)
+
+
+class HabitBatch(BaseModel):
+    """Validation for batch_habits parameters."""
+
+    operations: list[HabitBatchOperation] = Field(min_length=1, max_length=50)
+
+
 class CalendarEventId(BaseModel):
     """Validation for calendar/event ID parameters."""
 
@@ -497,6 +569,12 @@ class CalendarEventId(BaseModel):
     event_id: str = Field(min_length=1)
 
 
+class EventBatch(BaseModel):
+    """Validation for get_events_bulk parameters."""
+
+    events: list[tuple[int, str]] = Field(min_length=1, max_length=50, description="(calendar_id, event_id) pairs")
+
+
 class EventInstanceId(BaseModel):
     """Validation for event instance ID parameters (habit instances)."""
 
@@ -521,9 +599,8 @@ class DateRange(BaseModel):
     @model_validator(mode="after")
     def validate_date_order(self) -> "DateRange":
         """Validate that start date is before or equal to end date."""
-        start_date = datetime.strptime(self.start, "%Y-%m-%d")
-        end_date = datetime.strptime(self.end, "%Y-%m-%d")
-        if start_date > end_date:
+        # Both are validated zero-padded YYYY-MM-DD, so string order is date order
+        if self.start > self.end:
             raise ValueError("start date must be before or equal to end date")
         return self
 
@@ -589,7 +666,7 @@ class UserAnalyticsRequest(BaseModel):
 
     start: str
     end: str
-    metric_name: AnalyticsMetric
+    metric_name: AnalyticsMetric | list[AnalyticsMetric]
 
     @field_validator("start", "end")
     @classmethod
@@ -597,6 +674,18 @@ class UserAnalyticsRequest(BaseModel):
         """Validate date is in YYYY-MM-DD format."""
         return cast(str, _validate_date_format(v))
 
+    @field_validator("metric_name")
+    @classmethod
+    def validate_metric_list(
+        cls, v: AnalyticsMetric | list[AnalyticsMetric]
+    ) -> AnalyticsMetric | list[AnalyticsMetric]:
+        """Validate a metric list is non-empty and drop duplicates, keeping order."""
+        if isinstance(v, list):
+            if not v:
+                raise ValueError("At least one metric is required")
+            return list(dict.fromkeys(v))
+        return v
+
 
 # --- Scheduling Validation Models ---
 
@@ -3,7 +3,7 @@
 Profiles allow users to limit which tools are exposed based on their needs:
 - minimal: Core tasks + habits basics + context (22 tools)
 - standard: Core productivity without niche tools (39 tools)
-- full: All tools (49 tools, default)
+- full: All tools (51 tools, default)
 """
 
 from typing import Literal
@@ -70,19 +70,21 @@ STANDARD_TOOLS: set[str] = MINIMAL_TOOLS | {
     "get_focus_insights",
 }
 
-# Full profile: All tools (49 tools)
+# Full profile: All tools (51 tools)
 FULL_TOOLS: set[str] = STANDARD_TOOLS | {
     # Scheduling (1)
     "find_available_times",
-    # Events advanced (2)
+    # Events advanced (3)
+    "get_events_bulk",
     "set_event_rsvp",
     "move_event",
-    # Habits advanced (5)
+    # Habits advanced (6)
     "lock_habit_instance",
     "unlock_habit_instance",
     "start_habit",
     "stop_habit",
     "convert_event_to_habit",
+    "batch_habits",
     # Habit extra (1) - get_habit wasn't in minimal
     "get_habit",
     # Tasks advanced (1)
@@ -1,69 +1,69 @@
 """Analytics tools for Reclaim.ai."""
 
+import asyncio
 from typing import Any
 
-from fastmcp.exceptions import ToolError
-from pydantic import ValidationError
-
 from reclaim_mcp.cache import ttl_cache
-from reclaim_mcp.client import ReclaimClient
-from reclaim_mcp.config import get_settings
-from reclaim_mcp.exceptions import RateLimitError, ReclaimError
+from reclaim_mcp.client import ReclaimClient, get_client
 from reclaim_mcp.models import DateRange, UserAnalyticsRequest
-from reclaim_mcp.utils import format_validation_errors
+from reclaim_mcp.utils import reclaim_errors
 
 
 def _get_client() -> ReclaimClient:
-    """Get a configured Reclaim client."""
-    settings = get_settings()
-    return ReclaimClient(settings)
+    """Get the shared Reclaim client."""
+    return get_client()
 
 
-@ttl_cache(ttl=300)
+@ttl_cache(ttl=300, stale_ttl=600)
+@reclaim_errors("getting user analytics")
 async def get_user_analytics(
     start: str,
     end: str,
-    metric_name: str,
+    metric_name: str | list[str],
 ) -> dict:
     """Get personal productivity analytics for the current user.
 
+    Several metrics can be requested at once by passing a list; they are
+    fetched concurrently (one upstream request per metric) instead of one
+    tool call after another.
+
     Args:
         start: Start date in ISO format (e.g., '2026-01-01')
         end: End date in ISO format (e.g., '2026-01-31')
-        metric_name: The metric to retrieve. One of:
+        metric_name: The metric to retrieve, or a list of metrics. One of:
             - DURATION_BY_CATEGORY
             - DURATION_BY_DATE_BY_CATEGORY
 
     Returns:
-        Analytics data with time breakdowns by category.
+        Analytics data with time breakdowns by category. For a list of
+        metrics, a dict mapping each metric name to its analytics data.
     """
     # Validate input using Pydantic model
-    try:
-        validated = UserAnalyticsRequest(
-            start=start,
-            end=end,
-            metric_name=metric_name,  # type: ignore[arg-type]
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        params: dict[str, Any] = {
-            "start": validated.start,
-            "end": validated.end,
-            "metricName": validated.metric_name.value,
-        }
-
-        result = await client.get("/api/analytics/user/V3", params=params)
-        return result
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error getting user analytics: {e}")
-
-
-@ttl_cache(ttl=300)
+    validated = UserAnalyticsRequest(
+        start=start,
+        end=end,
+        metric_name=metric_name,  # type: ignore[arg-type]
+    )
+
+    if isinstance(validated.metric_name, list):
+        # Fan out through the cached single-metric path so each metric is cached on its own
+        metrics = [metric.value for metric in validated.metric_name]
+        results = await asyncio.gather(*(get_user_analytics(validated.start, validated.end, m) for m in metrics))
+        return dict(zip(metrics, results))
+
+    client = _get_client()
+    params: dict[str, Any] = {
+        "start": validated.start,
+        "end": validated.end,
+        "metricName": validated.metric_name.value,
+    }
+
+    result = await client.get("/api/analytics/user/V3", params=params)
+    return result
+
+
+@ttl_cache(ttl=300, stale_ttl=600)
+@reclaim_errors("getting focus insights")
 async def get_focus_insights(
     start: str,
     end: str,
@@ -78,21 +78,13 @@ async def get_focus_insights(
         Focus time analytics including protected hours, interruptions, etc.
     """
     # Validate input using Pydantic model
-    try:
-        validated = DateRange(start=start, end=end)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        params: dict[str, Any] = {
-            "start": validated.start,
-            "end": validated.end,
-        }
-
-        result = await client.get("/api/analytics/focus/insights/V3", params=params)
-        return result
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error getting focus insights: {e}")
+    validated = DateRange(start=start, end=end)
+
+    client = _get_client()
+    params: dict[str, Any] = {
+        "start": validated.start,
+        "end": validated.end,
+    }
+
+    result = await client.get("/api/analytics/focus/insights/V3", params=params)
+    return result
@@ -1,20 +1,20 @@
 """Calendar and event tools for Reclaim.ai."""
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import date, timedelta
 from typing import Any, Optional
 
 from fastmcp.exceptions import ToolError
-from pydantic import ValidationError
 
-from reclaim_mcp.cache import invalidate_cache, ttl_cache
-from reclaim_mcp.client import ReclaimClient
-from reclaim_mcp.config import get_settings
-from reclaim_mcp.exceptions import NotFoundError, RateLimitError, ReclaimError
-from reclaim_mcp.utils import format_validation_errors
+from reclaim_mcp.cache import SCHEDULE_CACHES, invalidate_cache, ttl_cache
+from reclaim_mcp.client import ReclaimClient, get_client
+from reclaim_mcp.exceptions import ReclaimError
+from reclaim_mcp.utils import reclaim_errors
 
 from reclaim_mcp.models import (  # isort: skip
     CalendarEventId,
     DateRange,
+    EventBatch,
     EventMove,
     EventRsvp,
     ListLimit,
@@ -23,9 +23,22 @@ from reclaim_mcp.models import (  # isort: skip
 
 
 def _get_client() -> ReclaimClient:
-    """Get a configured Reclaim client."""
-    settings = get_settings()
-    return ReclaimClient(settings)
+    """Get the shared Reclaim client."""
+    return get_client()
+
+
+def _invalidate_event_caches() -> None:
+    """Drop cached reads affected by an event mutation."""
+    invalidate_cache(*SCHEDULE_CACHES)
+
+
+# Event lists that end before today rarely change, so they are cached longer
+_PAST_EVENTS_TTL = 3600
+
+
+def _list_events_ttl(start: str, end: str, *args: Any, **kwargs: Any) -> int:
+    """Cache TTL for list_events: long for ranges entirely in the past."""
+    return _PAST_EVENTS_TTL if _extract_date(end) < date.today().isoformat() else 60
 
 
 def _extract_date(datetime_str: str) -> str:
@@ -37,7 +50,8 @@ def _extract_date(datetime_str: str) -> str:
     return datetime_str[:10]
 
 
-@ttl_cache(ttl=60)
+@ttl_cache(ttl=_list_events_ttl)
+@reclaim_errors("listing events")
 async def list_events(
     start: str,
     end: str,
@@ -58,32 +72,25 @@ async def list_events(
         List of event objects with eventId, title, eventStart, eventEnd, etc.
     """
     # Validate input using Pydantic model
-    try:
-        validated = DateRange(start=_extract_date(start), end=_extract_date(end))
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated = DateRange(start=_extract_date(start), end=_extract_date(end))
 
-    try:
-        client = _get_client()
-        params: dict[str, Any] = {
-            "start": validated.start,
-            "end": validated.end,
-            "thin": thin,
-        }
-        if calendar_ids:
-            params["calendarIds"] = ",".join(str(c) for c in calendar_ids)
-        if event_type:
-            params["type"] = event_type
+    client = _get_client()
+    params: dict[str, Any] = {
+        "start": validated.start,
+        "end": validated.end,
+        "thin": thin,
+    }
+    if calendar_ids:
+        params["calendarIds"] = ",".join(map(str, calendar_ids))
+    if event_type:
+        params["type"] = event_type
 
-        events = await client.get("/api/events", params=params)
-        return events
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error listing events: {e}")
+    events = await client.get("/api/events", params=params)
+    return events
 
 
 @ttl_cache(ttl=60)
+@reclaim_errors("listing personal events")
 async def list_personal_events(
     start: Optional[str] = None,
     end: Optional[str] = None,
@@ -100,28 +107,23 @@ async def list_personal_events(
         List of personal event objects.
     """
     # Validate limit using Pydantic model
-    try:
-        validated_limit = ListLimit(limit=limit)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated_limit = ListLimit(limit=limit)
 
     # Default to current week if dates not provided
     start_date = start
     end_date = end
-    if start_date is None:
-        start_date = datetime.now().strftime("%Y-%m-%d")
-    if end_date is None:
-        end_dt = datetime.now() + timedelta(days=7)
-        end_date = end_dt.strftime("%Y-%m-%d")
+    if start_date is None or end_date is None:
+        today = date.today()
+        if start_date is None:
+            start_date = today.isoformat()
+        if end_date is None:
+            end_date = (today + timedelta(days=7)).isoformat()
 
     # Validate dates using Pydantic model
-    try:
-        validated_dates = OptionalDateRange(
-            start=_extract_date(start_date),
-            end=_extract_date(end_date),
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated_dates = OptionalDateRange(
+        start=_extract_date(start_date),
+        end=_extract_date(end_date),
+    )
 
     try:
         client = _get_client()
@@ -133,15 +135,14 @@ async def list_personal_events(
 
         events = await client.get("/api/events/personal", params=params)
         return events
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error listing personal events: {e}")
+    except ReclaimError:
+        raise
     except Exception as e:
         # Catch unexpected errors to help diagnose issues like the limit>17 bug
         raise ToolError(f"Unexpected error listing personal events: {type(e).__name__}: {e}")
 
 
+@reclaim_errors("getting event {event_id}", not_found="Event {event_id} not found in calendar {calendar_id}")
 async def get_event(
     calendar_id: int,
     event_id: str,
@@ -161,32 +162,60 @@ async def get_event(
         Event object with full details.
     """
     # Validate input using Pydantic model
-    try:
-        validated = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
+
+    client = _get_client()
+    params: dict[str, Any] = {"thin": thin}
+    event = await client.get(
+        f"/api/events/{validated.calendar_id}/{validated.event_id}",
+        params=params,
+    )
+    return event
 
-    try:
-        client = _get_client()
-        params: dict[str, Any] = {"thin": thin}
-        event = await client.get(
-            f"/api/events/{validated.calendar_id}/{validated.event_id}",
-            params=params,
-        )
-        return event
-    except NotFoundError:
-        # fmt: off
-        raise ToolError(
-            f"Event {validated.event_id} not found in calendar "
-            f"{validated.calendar_id}"
-        )
-        # fmt: on
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error getting event {validated.event_id}: {e}")
 
+@reclaim_errors("getting events")
+async def get_events_bulk(
+    events: list[tuple[int, str]],
+    thin: bool = False,
+) -> list[dict]:
+    """Get several events at once by calendar ID and event ID.
+
+    The lookups run concurrently on the shared client instead of one
+    get_event call after another. A lookup that fails (e.g. 404) does not
+    fail the others.
+
+    Args:
+        events: (calendar_id, event_id) pairs, e.g. [[123, "abc"], [123, "def"]] (max 50)
+        thin: If True, return minimal event data (default False for full details)
 
+    Returns:
+        One entry per pair, in order: the event object, or a dict with
+        calendarId, eventId and error if that event could not be fetched.
+    """
+    # Validate input using Pydantic model
+    validated = EventBatch(events=events)
+
+    results = await asyncio.gather(
+        *(get_event(calendar_id, event_id, thin) for calendar_id, event_id in validated.events),
+        return_exceptions=True,
+    )
+
+    events_out: list[dict] = []
+    for (calendar_id, event_id), result in zip(validated.events, results):
+        if isinstance(result, ToolError):
+            events_out.append({"calendarId": calendar_id, "eventId": event_id, "error": str(result)})
+        elif isinstance(result, Exception):
+            # Transport errors (timeouts, dropped connections) only fail their own lookup
+            error = f"{type(result).__name__}: {result}"
+            events_out.append({"calendarId": calendar_id, "eventId": event_id, "error": error})
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            events_out.append(result)
+    return events_out
+
+
+@reclaim_errors("setting RSVP for event {event_id}", not_found="Event {event_id} not found in calendar {calendar_id}")
 async def set_event_rsvp(
     calendar_id: int,
     event_id: str,
@@ -205,34 +234,25 @@ async def set_event_rsvp(
         Planner action result with updated event state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = EventRsvp(
-            calendar_id=calendar_id,
-            event_id=event_id,
-            rsvp_status=rsvp_status,  # type: ignore[arg-type]
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.put(
-            f"/api/planner/event/rsvp/{validated.calendar_id}/{validated.event_id}",
-            {
-                "responseStatus": validated.rsvp_status.value,
-                "sendUpdates": send_updates,
-            },
-        )
-        invalidate_cache("list_events")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Event {event_id} not found in calendar {calendar_id}")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error setting RSVP for event {event_id}: {e}")
-
-
+    validated = EventRsvp(
+        calendar_id=calendar_id,
+        event_id=event_id,
+        rsvp_status=rsvp_status,  # type: ignore[arg-type]
+    )
+
+    client = _get_client()
+    result = await client.put(
+        f"/api/planner/event/rsvp/{validated.calendar_id}/{validated.event_id}",
+        {
+            "responseStatus": validated.rsvp_status.value,
+            "sendUpdates": send_updates,
+        },
+    )
+    _invalidate_event_caches()
+    return result
+
+
+@reclaim_errors("moving event {event_id}", not_found="Event {event_id} not found")
 async def move_event(
     event_id: str,
     start_time: str,
@@ -249,29 +269,18 @@ async def move_event(
         Planner action result with updated event state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = EventMove(
-            event_id=event_id,
-            start_time=start_time,
-            end_time=end_time,
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        # v1 API: uses query params instead of body
-        result = await client.post(
-            f"/api/planner/event/move/{validated.event_id}",
-            {},  # Empty body
-            params={"start": validated.start_time, "end": validated.end_time},
-        )
-        invalidate_cache("list_events")
-        invalidate_cache("list_personal_events")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Event {event_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error moving event {event_id}: {e}")
+    validated = EventMove(
+        event_id=event_id,
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+    client = _get_client()
+    # v1 API: uses query params instead of body
+    result = await client.post(
+        f"/api/planner/event/move/{validated.event_id}",
+        {},  # Empty body
+        params={"start": validated.start_time, "end": validated.end_time},
+    )
+    _invalidate_event_caches()
+    return result
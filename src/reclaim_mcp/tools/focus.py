@@ -2,40 +2,36 @@
 
 from typing import Any, Optional
 
-from fastmcp.exceptions import ToolError
-from pydantic import ValidationError
-
-from reclaim_mcp.cache import invalidate_cache, ttl_cache
-from reclaim_mcp.client import ReclaimClient
-from reclaim_mcp.config import get_settings
-from reclaim_mcp.exceptions import NotFoundError, RateLimitError, ReclaimError
+from reclaim_mcp.cache import SCHEDULE_CACHES, invalidate_cache, ttl_cache, update_cached
+from reclaim_mcp.client import ReclaimClient, get_client
 from reclaim_mcp.models import CalendarEventId, FocusReschedule, FocusSettingsUpdate
-from reclaim_mcp.utils import format_validation_errors
+from reclaim_mcp.utils import reclaim_errors
 
 
 def _get_client() -> ReclaimClient:
-    """Get a configured Reclaim client."""
-    settings = get_settings()
-    return ReclaimClient(settings)
+    """Get the shared Reclaim client."""
+    return get_client()
+
+
+def _invalidate_focus_block_caches() -> None:
+    """Drop cached reads affected by a focus block mutation."""
+    invalidate_cache(*SCHEDULE_CACHES)
 
 
-@ttl_cache(ttl=120)
+@ttl_cache(ttl=600)
+@reclaim_errors("getting focus settings")
 async def get_focus_settings() -> list[dict]:
     """Get current focus time settings for the user.
 
     Returns:
         List of focus settings objects (one per focus type).
     """
-    try:
-        client = _get_client()
-        result = await client.get("/api/focus-settings/user")
-        return result
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error getting focus settings: {e}")
+    client = _get_client()
+    result = await client.get("/api/focus-settings/user")
+    return result
 
 
+@reclaim_errors("updating focus settings", not_found="Focus settings {settings_id} not found")
 async def update_focus_settings(
     settings_id: int,
     min_duration_mins: Optional[int] = None,
@@ -58,43 +54,32 @@ async def update_focus_settings(
         Updated focus settings.
     """
     # Validate input using Pydantic model
-    try:
-        validated = FocusSettingsUpdate(
-            min_duration_mins=min_duration_mins,
-            ideal_duration_mins=ideal_duration_mins,
-            max_duration_mins=max_duration_mins,
-            defense_aggression=defense_aggression,  # type: ignore[arg-type]
-            enabled=enabled,
+    validated = FocusSettingsUpdate(
+        min_duration_mins=min_duration_mins,
+        ideal_duration_mins=ideal_duration_mins,
+        max_duration_mins=max_duration_mins,
+        defense_aggression=defense_aggression,  # type: ignore[arg-type]
+        enabled=enabled,
+    )
+
+    client = _get_client()
+
+    update_data: dict[str, Any] = validated.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    result = await client.patch(f"/api/focus-settings/user/{settings_id}", update_data)
+    if isinstance(result, dict) and result.get("id") == settings_id:
+        # The PATCH returns the updated settings; swap them into the cached list
+        update_cached(
+            "get_focus_settings", lambda cached: [result if s.get("id") == settings_id else s for s in cached]
         )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-
-        update_data: dict[str, Any] = {}
-        if validated.min_duration_mins is not None:
-            update_data["minDurationMins"] = validated.min_duration_mins
-        if validated.ideal_duration_mins is not None:
-            update_data["idealDurationMins"] = validated.ideal_duration_mins
-        if validated.max_duration_mins is not None:
-            update_data["maxDurationMins"] = validated.max_duration_mins
-        if validated.defense_aggression is not None:
-            update_data["defenseAggression"] = validated.defense_aggression.value
-        if validated.enabled is not None:
-            update_data["enabled"] = validated.enabled
-
-        result = await client.patch(f"/api/focus-settings/user/{settings_id}", update_data)
+    else:
         invalidate_cache("get_focus_settings")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Focus settings {settings_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error updating focus settings: {e}")
+    return result
 
 
+@reclaim_errors(
+    "locking focus block {event_id}", not_found="Focus block {event_id} not found in calendar {calendar_id}"
+)
 async def lock_focus_block(calendar_id: int, event_id: str) -> dict:
     """Lock a focus time block to prevent it from being rescheduled.
 
@@ -106,33 +91,20 @@ async def lock_focus_block(calendar_id: int, event_id: str) -> dict:
         Planner action result with updated event state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(
-            f"/api/focus/planner/{validated.calendar_id}/{validated.event_id}/lock",
-            {},
-        )
-        invalidate_cache("list_events")
-        invalidate_cache("list_personal_events")
-        return result
-    except NotFoundError:
-        # fmt: off
-        raise ToolError(
-            f"Focus block {validated.event_id} not found in calendar "
-            f"{validated.calendar_id}"
-        )
-        # fmt: on
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error locking focus block {validated.event_id}: {e}")
+    validated = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
+
+    client = _get_client()
+    result = await client.post(
+        f"/api/focus/planner/{validated.calendar_id}/{validated.event_id}/lock",
+        {},
+    )
+    _invalidate_focus_block_caches()
+    return result
 
 
+@reclaim_errors(
+    "unlocking focus block {event_id}", not_found="Focus block {event_id} not found in calendar {calendar_id}"
+)
 async def unlock_focus_block(calendar_id: int, event_id: str) -> dict:
     """Unlock a focus time block to allow it to be rescheduled.
 
@@ -144,33 +116,20 @@ async def unlock_focus_block(calendar_id: int, event_id: str) -> dict:
         Planner action result with updated event state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(
-            f"/api/focus/planner/{validated.calendar_id}/{validated.event_id}/unlock",
-            {},
-        )
-        invalidate_cache("list_events")
-        invalidate_cache("list_personal_events")
-        return result
-    except NotFoundError:
-        # fmt: off
-        raise ToolError(
-            f"Focus block {validated.event_id} not found in calendar "
-            f"{validated.calendar_id}"
-        )
-        # fmt: on
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error unlocking focus block {validated.event_id}: {e}")
+    validated = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
+
+    client = _get_client()
+    result = await client.post(
+        f"/api/focus/planner/{validated.calendar_id}/{validated.event_id}/unlock",
+        {},
+    )
+    _invalidate_focus_block_caches()
+    return result
 
 
+@reclaim_errors(
+    "rescheduling focus block {event_id}", not_found="Focus block {event_id} not found in calendar {calendar_id}"
+)
 async def reschedule_focus_block(
     calendar_id: int,
     event_id: str,
@@ -189,39 +148,19 @@ async def reschedule_focus_block(
         Planner action result with updated event state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = FocusReschedule(
-            calendar_id=calendar_id,
-            event_id=event_id,
-            start_time=start_time,
-            end_time=end_time,
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        payload: dict[str, Any] = {}
-        if validated.start_time is not None:
-            payload["start"] = validated.start_time
-        if validated.end_time is not None:
-            payload["end"] = validated.end_time
-
-        result = await client.post(
-            f"/api/focus/planner/{validated.calendar_id}/{validated.event_id}/reschedule",
-            payload,
-        )
-        invalidate_cache("list_events")
-        invalidate_cache("list_personal_events")
-        return result
-    except NotFoundError:
-        # fmt: off
-        raise ToolError(
-            f"Focus block {validated.event_id} not found in calendar "
-            f"{validated.calendar_id}"
-        )
-        # fmt: on
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error rescheduling focus block {validated.event_id}: {e}")
+    validated = FocusReschedule(
+        calendar_id=calendar_id,
+        event_id=event_id,
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+    client = _get_client()
+    payload: dict[str, Any] = validated.model_dump(by_alias=True, exclude_none=True, include={"start_time", "end_time"})
+
+    result = await client.post(
+        f"/api/focus/planner/{validated.calendar_id}/{validated.event_id}/reschedule",
+        payload,
+    )
+    _invalidate_focus_block_caches()
+    return result
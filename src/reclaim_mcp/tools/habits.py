@@ -1,42 +1,171 @@
 """Smart Habit tools for Reclaim.ai."""
 
-from typing import Any, Optional
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
 
 from fastmcp.exceptions import ToolError
-from pydantic import ValidationError
 
-from reclaim_mcp.cache import invalidate_cache, ttl_cache
-from reclaim_mcp.client import ReclaimClient
-from reclaim_mcp.config import get_settings
-from reclaim_mcp.exceptions import NotFoundError, RateLimitError, ReclaimError
-from reclaim_mcp.models import CalendarEventId, EventInstanceId, HabitCreate, HabitId, HabitUpdate
-from reclaim_mcp.utils import format_validation_errors
+from reclaim_mcp.cache import (
+    SCHEDULE_CACHES,
+    invalidate_cache,
+    invalidate_entry,
+    is_live_fetch,
+    prime_entry,
+    ttl_cache,
+    update_cached,
+)
+from reclaim_mcp.client import ReclaimClient, get_client
+from reclaim_mcp.models import (
+    CalendarEventId,
+    EventInstanceId,
+    HabitBatch,
+    HabitBatchAction,
+    HabitCreate,
+    HabitId,
+    HabitUpdate,
+)
+from reclaim_mcp.utils import reclaim_errors
 
 
 def _get_client() -> ReclaimClient:
-    """Get a configured Reclaim client."""
-    settings = get_settings()
-    return ReclaimClient(settings)
+    """Get the shared Reclaim client."""
+    return get_client()
 
 
-@ttl_cache(ttl=120)
+# Cached reads that can change when a habit or habit instance is mutated
+_HABIT_MUTATION_CACHES = ("list_habits", "get_habit", *SCHEDULE_CACHES)
+
+
+# The same reads minus get_habit, for mutations of one known habit
+_HABIT_SERIES_CACHES = tuple(prefix for prefix in _HABIT_MUTATION_CACHES if prefix != "get_habit")
+
+
+# Habit reads are cached for as long as habits have gone unchanged, within
+# these bounds: short right after a mutation, long in read-only stretches
+_HABITS_MIN_TTL = 30
+_HABITS_MAX_TTL = 600
+_last_habit_mutation = time.monotonic()
+
+
+def _habits_ttl(*args: Any, **kwargs: Any) -> int:
+    """Cache TTL for list_habits and get_habit, adapted to the time since the last habit mutation."""
+    unchanged_for = time.monotonic() - _last_habit_mutation
+    return int(min(_HABITS_MAX_TTL, max(_HABITS_MIN_TTL, unchanged_for)))
+
+
+def _invalidate_habit_caches(
+    lineage_id: Optional[int] = None,
+    list_update: Optional[Callable[[list[dict]], list[dict]]] = None,
+) -> None:
+    """Drop cached reads affected by a habit mutation.
+
+    Args:
+        lineage_id: The habit that changed, if known. Only its get_habit entry
+            is dropped; otherwise all cached get_habit entries are.
+        list_update: Applies the mutation to cached list_habits results in
+            place. If omitted, list_habits is invalidated like the other reads.
+    """
+    global _last_habit_mutation
+    _last_habit_mutation = time.monotonic()
+    prefixes = _HABIT_MUTATION_CACHES if lineage_id is None else _HABIT_SERIES_CACHES
+    if list_update is not None:
+        update_cached("list_habits", list_update)
+        prefixes = tuple(prefix for prefix in prefixes if prefix != "list_habits")
+    invalidate_cache(*prefixes)
+    if lineage_id is not None:
+        invalidate_entry(get_habit, lineage_id)
+
+
+def _habit_list_update(habit: Any, remove: Optional[int] = None) -> Optional[Callable[[list[dict]], list[dict]]]:
+    """Build a list_habits cache update for a habit mutation, if one is safe.
+
+    Args:
+        habit: Habit returned by the API (added, or replacing the cached entry
+            with the same lineageId), or None when nothing is added.
+        remove: Lineage ID to drop from the cached list (deletes).
+
+    Returns:
+        Update function for update_cached, or None if the response isn't a
+        habit object and the cached list has to be invalidated instead.
+    """
+    if remove is None:
+        if not isinstance(habit, dict) or "lineageId" not in habit:
+            return None
+        remove = habit["lineageId"]
+
+    def update(habits: list[dict]) -> list[dict]:
+        # Replace in place to keep the API's ordering; new habits go last
+        updated = [h for h in habits if h.get("lineageId") != remove]
+        if habit is not None:
+            index = next((i for i, h in enumerate(habits) if h.get("lineageId") == remove), len(updated))
+            updated.insert(index, habit)
+        return updated
+
+    return update
+
+
+def _build_habit_payload(validated: HabitCreate) -> dict[str, Any]:
+    """Build the smart-habit request body shared by create_habit and convert_event_to_habit.
+
+    Args:
+        validated: Validated habit fields.
+
+    Returns:
+        Request payload in the Reclaim smart-habits API schema.
+    """
+    # Build recurrence object
+    recurrence: dict[str, Any] = {"frequency": validated.frequency.value}
+    if validated.ideal_days:
+        recurrence["idealDays"] = [d.value for d in validated.ideal_days]
+
+    # Determine time policy type based on event type if not explicitly provided
+    time_policy = validated.time_policy_type
+    if time_policy is None:
+        if validated.event_type.value == "PERSONAL":
+            time_policy_str = "PERSONAL"
+        else:
+            time_policy_str = "WORK"
+    else:
+        time_policy_str = time_policy.value
+
+    payload: dict[str, Any] = {
+        "title": validated.title,
+        "idealTime": validated.ideal_time,
+        "durationMinMins": validated.duration_min_mins,
+        "durationMaxMins": validated.duration_max_mins or validated.duration_min_mins,
+        "enabled": validated.enabled,
+        "recurrence": recurrence,
+        "organizer": {"timePolicyType": time_policy_str},
+        "eventType": validated.event_type.value,
+        "defenseAggression": validated.defense_aggression.value,
+    }
+    if validated.description:
+        payload["description"] = validated.description
+    return payload
+
+
+@ttl_cache(ttl=_habits_ttl)
+@reclaim_errors("listing habits")
 async def list_habits() -> list[dict]:
     """List all smart habits from Reclaim.ai.
 
     Returns:
         List of habit objects with lineageId, title, enabled, recurrence, etc.
     """
-    try:
-        client = _get_client()
-        habits = await client.get("/api/smart-habits")
-        return habits
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error listing habits: {e}")
-
-
-@ttl_cache(ttl=60)
+    client = _get_client()
+    habits = await client.get("/api/smart-habits")
+    # Each entry is the same SmartHabitLineageView get_habit returns, so warm its
+    # cache, unless a habit mutation invalidated this fetch while it was in flight
+    if is_live_fetch(list_habits):
+        for habit in habits:
+            if isinstance(habit, dict) and "lineageId" in habit:
+                prime_entry(get_habit, habit, habit["lineageId"])
+    return habits
+
+
+@ttl_cache(ttl=_habits_ttl)
+@reclaim_errors("getting habit {lineage_id}", not_found="Habit {lineage_id} not found")
 async def get_habit(lineage_id: int) -> dict:
     """Get a single smart habit by lineage ID.
 
@@ -47,23 +176,14 @@ async def get_habit(lineage_id: int) -> dict:
         SmartHabitLineageView object with full details.
     """
     # Validate input using Pydantic model
-    try:
-        validated = HabitId(lineage_id=lineage_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        habit = await client.get(f"/api/smart-habits/{validated.lineage_id}")
-        return habit
-    except NotFoundError:
-        raise ToolError(f"Habit {validated.lineage_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error getting habit {validated.lineage_id}: {e}")
+    validated = HabitId(lineage_id=lineage_id)
+
+    client = _get_client()
+    habit = await client.get(f"/api/smart-habits/{validated.lineage_id}")
+    return habit
 
 
+@reclaim_errors("creating habit '{title}'")
 async def create_habit(
     title: str,
     ideal_time: str,
@@ -96,71 +216,30 @@ async def create_habit(
         Created habit object.
     """
     # Validate input using Pydantic model
-    try:
-        validated = HabitCreate(
-            title=title,
-            ideal_time=ideal_time,
-            duration_min_mins=duration_min_mins,
-            duration_max_mins=duration_max_mins,
-            frequency=frequency,  # type: ignore[arg-type]
-            ideal_days=ideal_days,  # type: ignore[arg-type]
-            event_type=event_type,  # type: ignore[arg-type]
-            defense_aggression=defense_aggression,  # type: ignore[arg-type]
-            description=description,
-            enabled=enabled,
-            time_policy_type=time_policy_type,  # type: ignore[arg-type]
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-
-        # Build recurrence object
-        recurrence: dict[str, Any] = {"frequency": validated.frequency.value}
-        if validated.ideal_days:
-            recurrence["idealDays"] = [d.value for d in validated.ideal_days]
-
-        # Determine time policy type based on event type if not explicitly provided
-        time_policy = validated.time_policy_type
-        if time_policy is None:
-            if validated.event_type.value == "PERSONAL":
-                time_policy_str = "PERSONAL"
-            else:
-                time_policy_str = "WORK"
-        else:
-            time_policy_str = time_policy.value
-
-        # Normalize ideal time to HH:MM:SS format
-        ideal_time_normalized = validated.ideal_time
-        if len(ideal_time_normalized) == 5:  # HH:MM format
-            ideal_time_normalized = f"{ideal_time_normalized}:00"
-
-        # Build request payload
-        payload: dict[str, Any] = {
-            "title": validated.title,
-            "idealTime": ideal_time_normalized,
-            "durationMinMins": validated.duration_min_mins,
-            "durationMaxMins": validated.duration_max_mins or validated.duration_min_mins,
-            "enabled": validated.enabled,
-            "recurrence": recurrence,
-            "organizer": {"timePolicyType": time_policy_str},
-            "eventType": validated.event_type.value,
-            "defenseAggression": validated.defense_aggression.value,
-        }
-        if validated.description:
-            payload["description"] = validated.description
-
-        habit = await client.post("/api/smart-habits", data=payload)
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return habit
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error creating habit '{title}': {e}")
-
-
+    validated = HabitCreate(
+        title=title,
+        ideal_time=ideal_time,
+        duration_min_mins=duration_min_mins,
+        duration_max_mins=duration_max_mins,
+        frequency=frequency,  # type: ignore[arg-type]
+        ideal_days=ideal_days,  # type: ignore[arg-type]
+        event_type=event_type,  # type: ignore[arg-type]
+        defense_aggression=defense_aggression,  # type: ignore[arg-type]
+        description=description,
+        enabled=enabled,
+        time_policy_type=time_policy_type,  # type: ignore[arg-type]
+    )
+
+    client = _get_client()
+    payload = _build_habit_payload(validated)
+    habit = await client.post("/api/smart-habits", data=payload)
+    # Other habits are unaffected, so keep their get_habit entries
+    new_id = habit.get("lineageId") if isinstance(habit, dict) else None
+    _invalidate_habit_caches(new_id, list_update=_habit_list_update(habit))
+    return habit
+
+
+@reclaim_errors("updating habit {lineage_id}", not_found="Habit {lineage_id} not found")
 async def update_habit(
     lineage_id: int,
     title: Optional[str] = None,
@@ -193,74 +272,44 @@ async def update_habit(
         Updated habit object.
     """
     # Validate lineage_id
-    try:
-        validated_id = HabitId(lineage_id=lineage_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated_id = HabitId(lineage_id=lineage_id)
 
     # Validate update fields using Pydantic model
-    try:
-        validated = HabitUpdate(
-            title=title,
-            ideal_time=ideal_time,
-            duration_min_mins=duration_min_mins,
-            duration_max_mins=duration_max_mins,
-            enabled=enabled,
-            frequency=frequency,  # type: ignore[arg-type]
-            ideal_days=ideal_days,  # type: ignore[arg-type]
-            event_type=event_type,  # type: ignore[arg-type]
-            defense_aggression=defense_aggression,  # type: ignore[arg-type]
-            description=description,
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-
-        payload: dict[str, Any] = {}
-        if validated.title is not None:
-            payload["title"] = validated.title
-        if validated.ideal_time is not None:
-            # Normalize ideal time to HH:MM:SS format
-            ideal_time_normalized = validated.ideal_time
-            if len(ideal_time_normalized) == 5:  # HH:MM format
-                ideal_time_normalized = f"{ideal_time_normalized}:00"
-            payload["idealTime"] = ideal_time_normalized
-        if validated.duration_min_mins is not None:
-            payload["durationMinMins"] = validated.duration_min_mins
-        if validated.duration_max_mins is not None:
-            payload["durationMaxMins"] = validated.duration_max_mins
-        if validated.enabled is not None:
-            payload["enabled"] = validated.enabled
-        if validated.description is not None:
-            payload["description"] = validated.description
-        if validated.event_type is not None:
-            payload["eventType"] = validated.event_type.value
-        if validated.defense_aggression is not None:
-            payload["defenseAggression"] = validated.defense_aggression.value
-
-        # Build recurrence object if any recurrence fields provided
-        if validated.frequency is not None or validated.ideal_days is not None:
-            recurrence: dict[str, Any] = {}
-            if validated.frequency is not None:
-                recurrence["frequency"] = validated.frequency.value
-            if validated.ideal_days is not None:
-                recurrence["idealDays"] = [d.value for d in validated.ideal_days]
-            payload["recurrence"] = recurrence
-
-        habit = await client.patch(f"/api/smart-habits/{validated_id.lineage_id}", data=payload)
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return habit
-    except NotFoundError:
-        raise ToolError(f"Habit {validated_id.lineage_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error updating habit {validated_id.lineage_id}: {e}")
+    validated = HabitUpdate(
+        title=title,
+        ideal_time=ideal_time,
+        duration_min_mins=duration_min_mins,
+        duration_max_mins=duration_max_mins,
+        enabled=enabled,
+        frequency=frequency,  # type: ignore[arg-type]
+        ideal_days=ideal_days,  # type: ignore[arg-type]
+        event_type=event_type,  # type: ignore[arg-type]
+        defense_aggression=defense_aggression,  # type: ignore[arg-type]
+        description=description,
+    )
+
+    client = _get_client()
+
+    # Fields set by the caller, already renamed to API keys by the model's aliases
+    payload: dict[str, Any] = validated.model_dump(
+        mode="json", by_alias=True, exclude_none=True, exclude={"frequency", "ideal_days"}
+    )
+
+    # Build recurrence object if any recurrence fields provided
+    if validated.frequency is not None or validated.ideal_days is not None:
+        recurrence: dict[str, Any] = {}
+        if validated.frequency is not None:
+            recurrence["frequency"] = validated.frequency.value
+        if validated.ideal_days is not None:
+            recurrence["idealDays"] = [d.value for d in validated.ideal_days]
+        payload["recurrence"] = recurrence
+
+    habit = await client.patch(f"/api/smart-habits/{validated_id.lineage_id}", data=payload)
+    _invalidate_habit_caches(lineage_id, list_update=_habit_list_update(habit))
+    return habit
 
 
+@reclaim_errors("deleting habit {lineage_id}", not_found="Habit {lineage_id} not found")
 async def delete_habit(lineage_id: int) -> bool:
     """Delete a smart habit.
 
@@ -271,25 +320,34 @@ async def delete_habit(lineage_id: int) -> bool:
         True if deleted successfully.
     """
     # Validate input using Pydantic model
-    try:
-        validated = HabitId(lineage_id=lineage_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        await client.delete(f"/api/smart-habits/{validated.lineage_id}")
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return True
-    except NotFoundError:
-        raise ToolError(f"Habit {validated.lineage_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error deleting habit {validated.lineage_id}: {e}")
+    validated = HabitId(lineage_id=lineage_id)
 
+    client = _get_client()
+    await client.delete(f"/api/smart-habits/{validated.lineage_id}")
+    _invalidate_habit_caches(lineage_id, list_update=_habit_list_update(None, remove=lineage_id))
+    return True
+
+
+async def _habit_instance_action(event_id: str, action: str) -> dict:
+    """Run a planner action on one habit instance.
+
+    Args:
+        event_id: The event ID of the habit instance
+        action: Planner action path segment (done, skip, lock or unlock)
 
+    Returns:
+        Action result with updated events and series info.
+    """
+    # Validate input using Pydantic model
+    validated = EventInstanceId(event_id=event_id)
+
+    client = _get_client()
+    result = await client.post(f"/api/smart-habits/planner/{validated.event_id}/{action}", data={})
+    _invalidate_habit_caches()
+    return result
+
+
+@reclaim_errors("marking habit done", not_found="Habit event {event_id} not found")
 async def mark_habit_done(event_id: str) -> dict:
     """Mark a habit instance as done.
 
@@ -301,26 +359,10 @@ async def mark_habit_done(event_id: str) -> dict:
     Returns:
         Action result with updated events and series info.
     """
-    # Validate input using Pydantic model
-    try:
-        validated = EventInstanceId(event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/smart-habits/planner/{validated.event_id}/done", data={})
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Habit event {validated.event_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error marking habit done: {e}")
+    return await _habit_instance_action(event_id, "done")
 
 
+@reclaim_errors("skipping habit", not_found="Habit event {event_id} not found")
 async def skip_habit(event_id: str) -> dict:
     """Skip a habit instance.
 
@@ -332,26 +374,10 @@ async def skip_habit(event_id: str) -> dict:
     Returns:
         Action result with updated events and series info.
     """
-    # Validate input using Pydantic model
-    try:
-        validated = EventInstanceId(event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/smart-habits/planner/{validated.event_id}/skip", data={})
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Habit event {validated.event_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error skipping habit: {e}")
+    return await _habit_instance_action(event_id, "skip")
 
 
+@reclaim_errors("locking habit instance", not_found="Habit event {event_id} not found")
 async def lock_habit_instance(event_id: str) -> dict:
     """Lock a habit instance to prevent it from being rescheduled.
 
@@ -361,26 +387,10 @@ async def lock_habit_instance(event_id: str) -> dict:
     Returns:
         Action result with updated events and series info.
     """
-    # Validate input using Pydantic model
-    try:
-        validated = EventInstanceId(event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/smart-habits/planner/{validated.event_id}/lock", data={})
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Habit event {validated.event_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error locking habit instance: {e}")
+    return await _habit_instance_action(event_id, "lock")
 
 
+@reclaim_errors("unlocking habit instance", not_found="Habit event {event_id} not found")
 async def unlock_habit_instance(event_id: str) -> dict:
     """Unlock a habit instance to allow it to be rescheduled.
 
@@ -390,30 +400,10 @@ async def unlock_habit_instance(event_id: str) -> dict:
     Returns:
         Action result with updated events and series info.
     """
-    # Validate input using Pydantic model
-    try:
-        validated = EventInstanceId(event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        # fmt: off
-        result = await client.post(
-            f"/api/smart-habits/planner/{validated.event_id}/unlock", data={}
-        )
-        # fmt: on
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Habit event {validated.event_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error unlocking habit instance: {e}")
+    return await _habit_instance_action(event_id, "unlock")
 
 
+@reclaim_errors("starting habit {lineage_id}", not_found="Habit {lineage_id} not found")
 async def start_habit(lineage_id: int) -> dict:
     """Start a habit session now.
 
@@ -424,29 +414,15 @@ async def start_habit(lineage_id: int) -> dict:
         Action result with updated events and series info.
     """
     # Validate input using Pydantic model
-    try:
-        validated = HabitId(lineage_id=lineage_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        # fmt: off
-        result = await client.post(
-            f"/api/smart-habits/planner/{validated.lineage_id}/start", data={}
-        )
-        # fmt: on
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Habit {validated.lineage_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error starting habit {validated.lineage_id}: {e}")
+    validated = HabitId(lineage_id=lineage_id)
+
+    client = _get_client()
+    result = await client.post(f"/api/smart-habits/planner/{validated.lineage_id}/start", data={})
+    _invalidate_habit_caches(lineage_id)
+    return result
 
 
+@reclaim_errors("stopping habit {lineage_id}", not_found="Habit {lineage_id} not found")
 async def stop_habit(lineage_id: int) -> dict:
     """Stop a currently running habit session.
 
@@ -457,29 +433,15 @@ async def stop_habit(lineage_id: int) -> dict:
         Action result with updated events and series info.
     """
     # Validate input using Pydantic model
-    try:
-        validated = HabitId(lineage_id=lineage_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        # fmt: off
-        result = await client.post(
-            f"/api/smart-habits/planner/{validated.lineage_id}/stop", data={}
-        )
-        # fmt: on
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Habit {validated.lineage_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error stopping habit {validated.lineage_id}: {e}")
+    validated = HabitId(lineage_id=lineage_id)
 
+    client = _get_client()
+    result = await client.post(f"/api/smart-habits/planner/{validated.lineage_id}/stop", data={})
+    _invalidate_habit_caches(lineage_id)
+    return result
 
+
+@reclaim_errors("enabling habit {lineage_id}", not_found="Habit {lineage_id} not found")
 async def enable_habit(lineage_id: int) -> dict:
     """Enable a disabled habit to resume scheduling.
 
@@ -490,25 +452,15 @@ async def enable_habit(lineage_id: int) -> dict:
         Empty dict on success.
     """
     # Validate input using Pydantic model
-    try:
-        validated = HabitId(lineage_id=lineage_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/smart-habits/{validated.lineage_id}/enable", data={})
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Habit {validated.lineage_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error enabling habit {validated.lineage_id}: {e}")
+    validated = HabitId(lineage_id=lineage_id)
+
+    client = _get_client()
+    result = await client.post(f"/api/smart-habits/{validated.lineage_id}/enable", data={})
+    _invalidate_habit_caches(lineage_id)
+    return result
 
 
+@reclaim_errors("disabling habit {lineage_id}", not_found="Habit {lineage_id} not found")
 async def disable_habit(lineage_id: int) -> bool:
     """Disable a habit to pause scheduling without deleting it.
 
@@ -519,25 +471,15 @@ async def disable_habit(lineage_id: int) -> bool:
         True if disabled successfully.
     """
     # Validate input using Pydantic model
-    try:
-        validated = HabitId(lineage_id=lineage_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        await client.delete(f"/api/smart-habits/{validated.lineage_id}/disable")
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return True
-    except NotFoundError:
-        raise ToolError(f"Habit {validated.lineage_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error disabling habit {validated.lineage_id}: {e}")
+    validated = HabitId(lineage_id=lineage_id)
 
+    client = _get_client()
+    await client.delete(f"/api/smart-habits/{validated.lineage_id}/disable")
+    _invalidate_habit_caches(lineage_id)
+    return True
 
+
+@reclaim_errors("converting event to habit", not_found="Event {event_id} not found in calendar {calendar_id}")
 async def convert_event_to_habit(
     calendar_id: int,
     event_id: str,
@@ -564,9 +506,9 @@ async def convert_event_to_habit(
         title: Habit name/title
         ideal_time: Preferred time in "HH:MM" format (e.g., "09:00")
         duration_min_mins: Minimum duration in minutes
-        frequency: Recurrence frequency (DAILY, WEEKLY, MONTHLY, YEARLY)
-        ideal_days: Days of week for WEEKLY frequency (MONDAY, TUESDAY, etc.)
-        event_type: Type of event (FOCUS, SOLO_WORK, PERSONAL, etc.)
+        frequency: Recurrence (DAILY, WEEKLY, MONTHLY, YEARLY) - default WEEKLY
+        ideal_days: Days for WEEKLY frequency (MONDAY, TUESDAY, etc.)
+        event_type: Type (FOCUS, SOLO_WORK, PERSONAL, etc.) - default SOLO_WORK
         defense_aggression: Protection level (DEFAULT, NONE, LOW, MEDIUM, HIGH, MAX)
         duration_max_mins: Maximum duration in minutes (defaults to min duration)
         description: Optional habit description
@@ -577,82 +519,86 @@ async def convert_event_to_habit(
         Created habit object.
     """
     # Validate calendar/event IDs using Pydantic model
-    try:
-        validated_event = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated_event = CalendarEventId(calendar_id=calendar_id, event_id=event_id)
 
     # Validate habit fields using Pydantic model
-    try:
-        validated = HabitCreate(
-            title=title,
-            ideal_time=ideal_time,
-            duration_min_mins=duration_min_mins,
-            duration_max_mins=duration_max_mins,
-            frequency=frequency,  # type: ignore[arg-type]
-            ideal_days=ideal_days,  # type: ignore[arg-type]
-            event_type=event_type,  # type: ignore[arg-type]
-            defense_aggression=defense_aggression,  # type: ignore[arg-type]
-            description=description,
-            enabled=enabled,
-            time_policy_type=time_policy_type,  # type: ignore[arg-type]
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-
-        # Build recurrence object
-        recurrence: dict[str, Any] = {"frequency": validated.frequency.value}
-        if validated.ideal_days:
-            recurrence["idealDays"] = [d.value for d in validated.ideal_days]
+    validated = HabitCreate(
+        title=title,
+        ideal_time=ideal_time,
+        duration_min_mins=duration_min_mins,
+        duration_max_mins=duration_max_mins,
+        frequency=frequency,  # type: ignore[arg-type]
+        ideal_days=ideal_days,  # type: ignore[arg-type]
+        event_type=event_type,  # type: ignore[arg-type]
+        defense_aggression=defense_aggression,  # type: ignore[arg-type]
+        description=description,
+        enabled=enabled,
+        time_policy_type=time_policy_type,  # type: ignore[arg-type]
+    )
+
+    client = _get_client()
+    payload = _build_habit_payload(validated)
+    habit = await client.post(
+        f"/api/smart-habits/convert/{validated_event.calendar_id}/{validated_event.event_id}",
+        data=payload,
+    )
+    # Other habits are unaffected, so keep their get_habit entries
+    new_id = habit.get("lineageId") if isinstance(habit, dict) else None
+    _invalidate_habit_caches(new_id, list_update=_habit_list_update(habit))
+    return habit
+
+
+# batch_habits action -> tool it runs
+_BATCH_ACTIONS: dict[HabitBatchAction, Callable[[Any], Awaitable[Any]]] = {
+    HabitBatchAction.MARK_DONE: mark_habit_done,
+    HabitBatchAction.SKIP: skip_habit,
+    HabitBatchAction.LOCK: lock_habit_instance,
+    HabitBatchAction.UNLOCK: unlock_habit_instance,
+    HabitBatchAction.GET: get_habit,
+    HabitBatchAction.START: start_habit,
+    HabitBatchAction.STOP: stop_habit,
+    HabitBatchAction.ENABLE: enable_habit,
+    HabitBatchAction.DISABLE: disable_habit,
+}
+
+
+@reclaim_errors("running habit batch")
+async def batch_habits(operations: list[dict]) -> list[dict]:
+    """Run several habit actions in one call.
+
+    Operations run concurrently on the shared client, so do not batch actions
+    that depend on each other's order (e.g. start and stop of the same habit).
+    A failed operation does not fail the others.
+
+    Args:
+        operations: Up to 50 operations, each a dict with "action" and the ID it needs:
+            - mark_done, skip, lock, unlock: "event_id" of the habit instance
+            - get, start, stop, enable, disable: "lineage_id" of the habit
+            Example: [{"action": "mark_done", "event_id": "abc"}, {"action": "enable", "lineage_id": 42}]
 
-        # Determine time policy type based on event type if not explicitly provided
-        time_policy = validated.time_policy_type
-        if time_policy is None:
-            if validated.event_type.value == "PERSONAL":
-                time_policy_str = "PERSONAL"
-            else:
-                time_policy_str = "WORK"
+    Returns:
+        One entry per operation, in order, with index, action, status ("ok" or
+        "error") and either result or error.
+    """
+    # Validate input using Pydantic model
+    validated = HabitBatch(operations=operations)  # type: ignore[arg-type]
+
+    results = await asyncio.gather(
+        *(_BATCH_ACTIONS[op.action](op.target) for op in validated.operations),
+        return_exceptions=True,
+    )
+
+    outcomes: list[dict] = []
+    for index, (op, result) in enumerate(zip(validated.operations, results)):
+        outcome: dict[str, Any] = {"index": index, "action": op.action.value}
+        if isinstance(result, ToolError):
+            outcome.update(status="error", error=str(result))
+        elif isinstance(result, Exception):
+            # Transport errors (timeouts, dropped connections) only fail their own operation
+            outcome.update(status="error", error=f"{type(result).__name__}: {result}")
+        elif isinstance(result, BaseException):
+            raise result
         else:
-            time_policy_str = time_policy.value
-
-        # Normalize ideal time to HH:MM:SS format
-        ideal_time_normalized = validated.ideal_time
-        if len(ideal_time_normalized) == 5:  # HH:MM format
-            ideal_time_normalized = f"{ideal_time_normalized}:00"
-
-        # Build request payload (same schema as create_habit)
-        payload: dict[str, Any] = {
-            "title": validated.title,
-            "idealTime": ideal_time_normalized,
-            "durationMinMins": validated.duration_min_mins,
-            "durationMaxMins": validated.duration_max_mins or validated.duration_min_mins,
-            "enabled": validated.enabled,
-            "recurrence": recurrence,
-            "organizer": {"timePolicyType": time_policy_str},
-            "eventType": validated.event_type.value,
-            "defenseAggression": validated.defense_aggression.value,
-        }
-        if validated.description:
-            payload["description"] = validated.description
-
-        habit = await client.post(
-            f"/api/smart-habits/convert/{validated_event.calendar_id}/{validated_event.event_id}",
-            data=payload,
-        )
-        invalidate_cache("list_habits")
-        invalidate_cache("get_habit")
-        return habit
-    except NotFoundError:
-        # fmt: off
-        raise ToolError(
-            f"Event {validated_event.event_id} not found in calendar "
-            f"{validated_event.calendar_id}"
-        )
-        # fmt: on
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error converting event to habit: {e}")
+            outcome.update(status="ok", result=result)
+        outcomes.append(outcome)
+    return outcomes
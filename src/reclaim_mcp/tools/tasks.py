@@ -2,21 +2,26 @@
 
 from typing import Any, Optional
 
-from fastmcp.exceptions import ToolError
-from pydantic import ValidationError
-
-from reclaim_mcp.cache import invalidate_cache, ttl_cache
-from reclaim_mcp.client import ReclaimClient
-from reclaim_mcp.config import get_settings
-from reclaim_mcp.exceptions import NotFoundError, RateLimitError, ReclaimError
+from reclaim_mcp.cache import SCHEDULE_CACHES, invalidate_cache, ttl_cache
+from reclaim_mcp.client import ReclaimClient, get_client
 from reclaim_mcp.models import ListLimit, PlanWork, TaskCreate, TaskId, TaskListParams, TaskSnooze, TaskUpdate, TimeLog
-from reclaim_mcp.utils import format_validation_errors
+from reclaim_mcp.utils import reclaim_errors
 
 
 def _get_client() -> ReclaimClient:
-    """Get a configured Reclaim client."""
-    settings = get_settings()
-    return ReclaimClient(settings)
+    """Get the shared Reclaim client."""
+    return get_client()
+
+
+# Cached reads that can change when a task is mutated. Task changes trigger
+# rescheduling, which moves task blocks on the calendar and can change the
+# current/next moment.
+_TASK_MUTATION_CACHES = ("list_tasks", "list_completed_tasks", *SCHEDULE_CACHES)
+
+
+def _invalidate_task_caches() -> None:
+    """Drop cached reads affected by a task mutation."""
+    invalidate_cache(*_TASK_MUTATION_CACHES)
 
 
 def _to_api_due_datetime(date_str: str) -> str:
@@ -30,6 +35,7 @@ def _to_api_due_datetime(date_str: str) -> str:
 
 
 @ttl_cache(ttl=60)
+@reclaim_errors("listing tasks")
 async def list_tasks(
     status: str = "NEW,SCHEDULED,IN_PROGRESS",
     limit: int = 50,
@@ -44,23 +50,16 @@ async def list_tasks(
         List of task objects with id, title, duration, due_date, status, etc.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskListParams(status=status, limit=limit)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        params = {"status": validated.status, "limit": validated.limit}
-        tasks = await client.get("/api/tasks", params=params)
-        return tasks
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error listing tasks: {e}")
+    validated = TaskListParams(status=status, limit=limit)
+
+    client = _get_client()
+    params = {"status": validated.status, "limit": validated.limit}
+    tasks = await client.get("/api/tasks", params=params)
+    return tasks
 
 
 @ttl_cache(ttl=120)
+@reclaim_errors("listing completed tasks")
 async def list_completed_tasks(limit: int = 50) -> list[dict]:
     """List completed and archived tasks from Reclaim.ai.
 
@@ -71,22 +70,15 @@ async def list_completed_tasks(limit: int = 50) -> list[dict]:
         List of completed/archived task objects.
     """
     # Validate input using Pydantic model
-    try:
-        validated = ListLimit(limit=limit)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        params = {"status": "COMPLETE,ARCHIVED", "limit": validated.limit}
-        tasks = await client.get("/api/tasks", params=params)
-        return tasks
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error listing completed tasks: {e}")
+    validated = ListLimit(limit=limit)
+
+    client = _get_client()
+    params = {"status": "COMPLETE,ARCHIVED", "limit": validated.limit}
+    tasks = await client.get("/api/tasks", params=params)
+    return tasks
 
 
+@reclaim_errors("getting task {task_id}", not_found="Task {task_id} not found")
 async def get_task(task_id: int) -> dict:
     """Get a single task by ID.
 
@@ -97,23 +89,14 @@ async def get_task(task_id: int) -> dict:
         Task object with all details.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        task = await client.get(f"/api/tasks/{validated.task_id}")
-        return task
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error getting task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
 
+    client = _get_client()
+    task = await client.get(f"/api/tasks/{validated.task_id}")
+    return task
 
+
+@reclaim_errors("creating task '{title}'")
 async def create_task(
     title: str,
     duration_minutes: int,
@@ -128,7 +111,7 @@ async def create_task(
     Args:
         title: Task title/description
         duration_minutes: Total time needed for the task in minutes
-        due_date: ISO datetime string or None for no deadline
+        due_date: ISO date string (YYYY-MM-DD) or None for no deadline
         min_chunk_size_minutes: Minimum time block size (default 15)
         max_chunk_size_minutes: Maximum time block size (None = duration)
         snooze_until: Don't schedule before this datetime (ISO format)
@@ -138,51 +121,37 @@ async def create_task(
         Created task object.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskCreate(
-            title=title,
-            duration_minutes=duration_minutes,
-            min_chunk_size_minutes=min_chunk_size_minutes,
-            max_chunk_size_minutes=max_chunk_size_minutes,
-            due_date=due_date,
-            snooze_until=snooze_until,
-            priority=priority,  # type: ignore[arg-type]
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-
-        # Convert minutes to time chunks (Reclaim uses 15-min chunks)
-        time_chunks = validated.duration_minutes // 15
-        if time_chunks < 1:
-            time_chunks = 1
-
-        payload: dict[str, Any] = {
-            "title": validated.title,
-            "timeChunksRequired": time_chunks,
-            "minChunkSize": validated.min_chunk_size_minutes,
-            "maxChunkSize": validated.max_chunk_size_minutes or validated.duration_minutes,
-            "eventCategory": "WORK",
-            "priority": validated.priority.value,
-        }
-
-        if validated.due_date is not None:
-            payload["deadline"] = validated.due_date
-        if validated.snooze_until is not None:
-            payload["snoozeUntil"] = validated.snooze_until
-
-        result = await client.post("/api/tasks", payload)
-        invalidate_cache("list_tasks")
-        invalidate_cache("list_completed_tasks")
-        return result
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error creating task '{validated.title}': {e}")
-
-
+    validated = TaskCreate(
+        title=title,
+        duration_minutes=duration_minutes,
+        min_chunk_size_minutes=min_chunk_size_minutes,
+        max_chunk_size_minutes=max_chunk_size_minutes,
+        due_date=due_date,
+        snooze_until=snooze_until,
+        priority=priority,  # type: ignore[arg-type]
+    )
+
+    client = _get_client()
+
+    # Convert minutes to time chunks (Reclaim uses 15-min chunks)
+    time_chunks = validated.duration_minutes // 15
+    if time_chunks < 1:
+        time_chunks = 1
+
+    # title, minChunkSize, priority and any provided deadline/snoozeUntil
+    payload: dict[str, Any] = validated.model_dump(
+        mode="json", by_alias=True, exclude_none=True, exclude={"duration_minutes", "max_chunk_size_minutes"}
+    )
+    payload["timeChunksRequired"] = time_chunks
+    payload["maxChunkSize"] = validated.max_chunk_size_minutes or validated.duration_minutes
+    payload["eventCategory"] = "WORK"
+
+    result = await client.post("/api/tasks", payload)
+    _invalidate_task_caches()
+    return result
+
+
+@reclaim_errors("updating task {task_id}", not_found="Task {task_id} not found")
 async def update_task(
     task_id: int,
     title: Optional[str] = None,
@@ -203,7 +172,7 @@ async def update_task(
         duration_minutes: New duration in minutes (optional)
         due_date: New due date in YYYY-MM-DD format (optional)
         status: New status - NEW, SCHEDULED, IN_PROGRESS, COMPLETE (optional)
-        priority: New priority - P1, P2, P3, P4 (optional)
+        priority: New priority - P1 (Critical), P2 (High), P3 (Medium), P4 (Low) (optional)
         snooze_until: Don't schedule before this datetime, ISO format (optional)
         notes: Update task notes (optional)
         min_chunk_size_minutes: Minimum time block size in minutes (optional)
@@ -213,65 +182,41 @@ async def update_task(
         Updated task object.
     """
     # Validate task_id
-    try:
-        validated_id = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated_id = TaskId(task_id=task_id)
 
     # Validate update fields using Pydantic model
-    try:
-        validated = TaskUpdate(
-            title=title,
-            duration_minutes=duration_minutes,
-            due_date=due_date,
-            status=status,  # type: ignore[arg-type]
-            priority=priority,  # type: ignore[arg-type]
-            snooze_until=snooze_until,
-            notes=notes,
-            min_chunk_size_minutes=min_chunk_size_minutes,
-            max_chunk_size_minutes=max_chunk_size_minutes,
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-
-        update_data: dict = {}
-        if validated.title is not None:
-            update_data["title"] = validated.title
-        if validated.duration_minutes is not None:
-            time_chunks = validated.duration_minutes // 15
-            if time_chunks < 1:
-                time_chunks = 1
-            update_data["timeChunksRequired"] = time_chunks
-        if validated.due_date is not None:
-            update_data["due"] = _to_api_due_datetime(validated.due_date)
-        if validated.status is not None:
-            update_data["status"] = validated.status.value
-        if validated.priority is not None:
-            update_data["priority"] = validated.priority.value
-        if validated.snooze_until is not None:
-            update_data["snoozeUntil"] = validated.snooze_until
-        if validated.notes is not None:
-            update_data["notes"] = validated.notes
-        if validated.min_chunk_size_minutes is not None:
-            update_data["minChunkSize"] = validated.min_chunk_size_minutes
-        if validated.max_chunk_size_minutes is not None:
-            update_data["maxChunkSize"] = validated.max_chunk_size_minutes
-
-        result = await client.patch(f"/api/tasks/{validated_id.task_id}", update_data)
-        invalidate_cache("list_tasks")
-        invalidate_cache("list_completed_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated_id.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error updating task {validated_id.task_id}: {e}")
+    validated = TaskUpdate(
+        title=title,
+        duration_minutes=duration_minutes,
+        due_date=due_date,
+        status=status,  # type: ignore[arg-type]
+        priority=priority,  # type: ignore[arg-type]
+        snooze_until=snooze_until,
+        notes=notes,
+        min_chunk_size_minutes=min_chunk_size_minutes,
+        max_chunk_size_minutes=max_chunk_size_minutes,
+    )
+
+    client = _get_client()
+
+    # Fields set by the caller, already renamed to API keys by the model's aliases
+    update_data: dict = validated.model_dump(
+        mode="json", by_alias=True, exclude_none=True, exclude={"duration_minutes", "due_date"}
+    )
+    if validated.duration_minutes is not None:
+        time_chunks = validated.duration_minutes // 15
+        if time_chunks < 1:
+            time_chunks = 1
+        update_data["timeChunksRequired"] = time_chunks
+    if validated.due_date is not None:
+        update_data["due"] = _to_api_due_datetime(validated.due_date)
 
+    result = await client.patch(f"/api/tasks/{validated_id.task_id}", update_data)
+    _invalidate_task_caches()
+    return result
 
+
+@reclaim_errors("marking task {task_id} complete", not_found="Task {task_id} not found")
 async def mark_task_complete(task_id: int) -> dict:
     """Mark a task as complete.
 
@@ -282,25 +227,15 @@ async def mark_task_complete(task_id: int) -> dict:
         Updated task object.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/planner/done/task/{validated.task_id}", {})
-        invalidate_cache("list_tasks")
-        invalidate_cache("list_completed_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error marking task {validated.task_id} complete: {e}")
+    validated = TaskId(task_id=task_id)
+
+    client = _get_client()
+    result = await client.post(f"/api/planner/done/task/{validated.task_id}", {})
+    _invalidate_task_caches()
+    return result
 
 
+@reclaim_errors("deleting task {task_id}", not_found="Task {task_id} not found")
 async def delete_task(task_id: int) -> bool:
     """Delete a task from Reclaim.ai.
 
@@ -311,133 +246,93 @@ async def delete_task(task_id: int) -> bool:
         True if deleted successfully.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.delete(f"/api/tasks/{validated.task_id}")
-        invalidate_cache("list_tasks")
-        invalidate_cache("list_completed_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error deleting task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
+
+    client = _get_client()
+    result = await client.delete(f"/api/tasks/{validated.task_id}")
+    _invalidate_task_caches()
+    return result
 
 
+@reclaim_errors("logging time for task {task_id}", not_found="Task {task_id} not found")
 async def add_time_to_task(
     task_id: int,
     minutes: int,
     notes: Optional[str] = None,
 ) -> dict:
-    """Log time spent on a task using the planner API.
+    """Log time spent on a task using Reclaim's planner API.
 
     Args:
         task_id: The task ID
         minutes: Minutes worked on the task
-        notes: Optional notes about the work done (stored separately via PATCH)
+        notes: Optional notes about the work done
 
     Returns:
-        Planner action result.
+        Planner action result confirming time was logged.
     """
     # Validate task_id
-    try:
-        validated_id = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
+    validated_id = TaskId(task_id=task_id)
 
     # Validate minutes using Pydantic model
-    try:
-        validated = TimeLog(minutes=minutes)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-
-        # Use the dedicated planner endpoint for time logging
-        # POST /api/planner/log-work/task/{taskId}?minutes=X
-        result = await client.post(
-            f"/api/planner/log-work/task/{validated_id.task_id}",
-            {},
-            params={"minutes": validated.minutes},
-        )
-
-        # If notes provided, update them separately on the task
-        if notes:
-            await client.patch(f"/api/tasks/{validated_id.task_id}", {"notes": notes})
-
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated_id.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error logging time for task {validated_id.task_id}: {e}")
+    validated = TimeLog(minutes=minutes)
+
+    client = _get_client()
+
+    # Use the dedicated planner endpoint for time logging
+    # POST /api/planner/log-work/task/{taskId}?minutes=X
+    result = await client.post(
+        f"/api/planner/log-work/task/{validated_id.task_id}",
+        {},
+        params={"minutes": validated.minutes},
+    )
 
+    # If notes provided, update them separately on the task
+    if notes:
+        await client.patch(f"/api/tasks/{validated_id.task_id}", {"notes": notes})
 
+    _invalidate_task_caches()
+    return result
+
+
+@reclaim_errors("starting task {task_id}", not_found="Task {task_id} not found")
 async def start_task(task_id: int) -> dict:
     """Start working on a task (marks as IN_PROGRESS and starts timer).
 
     Args:
-        task_id: The task ID to start
+        task_id: The task ID to start working on
 
     Returns:
         Planner action result with updated task state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/planner/start/task/{validated.task_id}", {})
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error starting task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
 
+    client = _get_client()
+    result = await client.post(f"/api/planner/start/task/{validated.task_id}", {})
+    _invalidate_task_caches()
+    return result
 
+
+@reclaim_errors("stopping task {task_id}", not_found="Task {task_id} not found")
 async def stop_task(task_id: int) -> dict:
     """Stop working on a task (pauses timer, keeps task active).
 
     Args:
-        task_id: The task ID to stop
+        task_id: The task ID to stop working on
 
     Returns:
         Planner action result with updated task state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/planner/stop/task/{validated.task_id}", {})
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error stopping task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
+
+    client = _get_client()
+    result = await client.post(f"/api/planner/stop/task/{validated.task_id}", {})
+    _invalidate_task_caches()
+    return result
 
 
+@reclaim_errors("prioritizing task {task_id}", not_found="Task {task_id} not found")
 async def prioritize_task(task_id: int) -> dict:
     """Prioritize a task (elevates to high priority, triggers rescheduling).
 
@@ -448,24 +343,15 @@ async def prioritize_task(task_id: int) -> dict:
         Planner action result with updated task state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/planner/prioritize/task/{validated.task_id}", {})
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error prioritizing task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
 
+    client = _get_client()
+    result = await client.post(f"/api/planner/prioritize/task/{validated.task_id}", {})
+    _invalidate_task_caches()
+    return result
 
+
+@reclaim_errors("restarting task {task_id}", not_found="Task {task_id} not found")
 async def restart_task(task_id: int) -> dict:
     """Restart a completed/archived task (returns it to active scheduling).
 
@@ -476,25 +362,15 @@ async def restart_task(task_id: int) -> dict:
         Planner action result with updated task state.
     """
     # Validate input using Pydantic model
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/planner/restart/task/{validated.task_id}", {})
-        invalidate_cache("list_tasks")
-        invalidate_cache("list_completed_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error restarting task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
+
+    client = _get_client()
+    result = await client.post(f"/api/planner/restart/task/{validated.task_id}", {})
+    _invalidate_task_caches()
+    return result
 
 
+@reclaim_errors("snoozing task {task_id}", not_found="Task {task_id} not found")
 async def snooze_task(task_id: int, snooze_option: str) -> dict:
     """Snooze a task for a preset duration.
 
@@ -506,31 +382,22 @@ async def snooze_task(task_id: int, snooze_option: str) -> dict:
     Returns:
         Planner action result with updated task state.
     """
-    try:
-        validated = TaskSnooze(
-            task_id=task_id,
-            snooze_option=snooze_option,  # type: ignore[arg-type]
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(
-            f"/api/planner/task/{validated.task_id}/snooze",
-            {},
-            params={"snoozeOption": validated.snooze_option.value},
-        )
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error snoozing task {validated.task_id}: {e}")
-
-
+    validated = TaskSnooze(
+        task_id=task_id,
+        snooze_option=snooze_option,  # type: ignore[arg-type]
+    )
+
+    client = _get_client()
+    result = await client.post(
+        f"/api/planner/task/{validated.task_id}/snooze",
+        {},
+        params={"snoozeOption": validated.snooze_option.value},
+    )
+    _invalidate_task_caches()
+    return result
+
+
+@reclaim_errors("clearing snooze for task {task_id}", not_found="Task {task_id} not found")
 async def clear_task_snooze(task_id: int) -> dict:
     """Clear a snooze on a task, making it immediately schedulable again.
 
@@ -540,24 +407,15 @@ async def clear_task_snooze(task_id: int) -> dict:
     Returns:
         Planner action result with updated task state.
     """
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/planner/task/{validated.task_id}/clear-snooze", {})
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error clearing snooze for task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
 
+    client = _get_client()
+    result = await client.post(f"/api/planner/task/{validated.task_id}/clear-snooze", {})
+    _invalidate_task_caches()
+    return result
 
+
+@reclaim_errors("unarchiving task {task_id}", not_found="Task {task_id} not found")
 async def unarchive_task(task_id: int) -> dict:
     """Restore an archived task back to active scheduling.
 
@@ -567,25 +425,15 @@ async def unarchive_task(task_id: int) -> dict:
     Returns:
         Planner action result with updated task state.
     """
-    try:
-        validated = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(f"/api/planner/unarchive/task/{validated.task_id}", {})
-        invalidate_cache("list_tasks")
-        invalidate_cache("list_completed_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error unarchiving task {validated.task_id}: {e}")
+    validated = TaskId(task_id=task_id)
+
+    client = _get_client()
+    result = await client.post(f"/api/planner/unarchive/task/{validated.task_id}", {})
+    _invalidate_task_caches()
+    return result
 
 
+@reclaim_errors("extending task {task_id}", not_found="Task {task_id} not found")
 async def extend_task_duration(task_id: int, minutes: int) -> dict:
     """Add more scheduled time to a task (extends capacity, doesn't log work).
 
@@ -596,68 +444,46 @@ async def extend_task_duration(task_id: int, minutes: int) -> dict:
     Returns:
         Planner action result with updated task state.
     """
-    try:
-        validated_id = TaskId(task_id=task_id)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        validated_time = TimeLog(minutes=minutes)
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(
-            f"/api/planner/add-time/task/{validated_id.task_id}",
-            {},
-            params={"minutes": validated_time.minutes},
-        )
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated_id.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error extending task {validated_id.task_id}: {e}")
+    validated_id = TaskId(task_id=task_id)
+
+    validated_time = TimeLog(minutes=minutes)
+
+    client = _get_client()
+    result = await client.post(
+        f"/api/planner/add-time/task/{validated_id.task_id}",
+        {},
+        params={"minutes": validated_time.minutes},
+    )
+    _invalidate_task_caches()
+    return result
 
 
+@reclaim_errors("planning work for task {task_id}", not_found="Task {task_id} not found")
 async def plan_work(task_id: int, date_time: str, duration_minutes: int) -> dict:
     """Schedule task work at a specific date/time.
 
     Args:
         task_id: The task ID to schedule
         date_time: When to schedule the work (ISO format, e.g., '2026-02-22T10:00:00Z')
-        duration_minutes: How long the work block should be
+        duration_minutes: How long the work block should be in minutes
 
     Returns:
         Planner action result with updated task state.
     """
-    try:
-        validated = PlanWork(
-            task_id=task_id,
-            date_time=date_time,
-            duration_minutes=duration_minutes,
-        )
-    except ValidationError as e:
-        raise ToolError(format_validation_errors(e))
-
-    try:
-        client = _get_client()
-        result = await client.post(
-            f"/api/planner/plan-work/task/{validated.task_id}",
-            {},
-            params={
-                "dateTime": validated.date_time,
-                "durationMinutes": validated.duration_minutes,
-            },
-        )
-        invalidate_cache("list_tasks")
-        return result
-    except NotFoundError:
-        raise ToolError(f"Task {validated.task_id} not found")
-    except RateLimitError as e:
-        raise ToolError(str(e))
-    except ReclaimError as e:
-        raise ToolError(f"Error planning work for task {validated.task_id}: {e}")
+    validated = PlanWork(
+        task_id=task_id,
+        date_time=date_time,
+        duration_minutes=duration_minutes,
+    )
+
+    client = _get_client()
+    result = await client.post(
+        f"/api/planner/plan-work/task/{validated.task_id}",
+        {},
+        params={
+            "dateTime": validated.date_time,
+            "durationMinutes": validated.duration_minutes,
+        },
+    )
+    _invalidate_task_caches()
+    return result
@@ -1,9 +1,70 @@
 """Shared utilities for Reclaim MCP tools."""
 
+import inspect
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar
+
+from fastmcp.exceptions import ToolError
 from pydantic import ValidationError
 
+from reclaim_mcp.exceptions import NotFoundError, RateLimitError, ReclaimError
+
+# Type variable for async functions
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 def format_validation_errors(e: ValidationError) -> str:
     """Format Pydantic validation errors into a user-friendly message."""
-    errors = "; ".join(err["msg"] for err in e.errors())
+    # Only "msg" is used, so skip building the url/context/input parts of each error
+    errors = "; ".join([err["msg"] for err in e.errors(include_url=False, include_context=False, include_input=False)])
     return f"Invalid input: {errors}"
+
+
+def reclaim_errors(action: str, not_found: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator translating validation and Reclaim API errors into ToolErrors.
+
+    Replaces the per-tool ``except ValidationError / RateLimitError /
+    ReclaimError`` blocks. Messages are formatted with the tool's arguments,
+    only when an error is actually raised.
+
+    Args:
+        action: What the tool was doing, reported as "Error {action}: {error}"
+            (e.g. "moving event {event_id}")
+        not_found: Message for a 404 (e.g. "Event {event_id} not found"). If
+            omitted, a 404 is reported like any other Reclaim error.
+
+    Returns:
+        Decorated function raising ToolError on failure.
+
+    Example:
+        @reclaim_errors("getting habit {habit_id}", not_found="Habit {habit_id} not found")
+        async def get_habit(habit_id: str) -> dict:
+            ...
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        def describe(template: str, args: tuple, kwargs: dict) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return template.format_map(bound.arguments)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except ValidationError as e:
+                raise ToolError(format_validation_errors(e))
+            except RateLimitError as e:
+                raise ToolError(str(e))
+            except NotFoundError as e:
+                if not_found is None:
+                    raise ToolError(f"Error {describe(action, args, kwargs)}: {e}")
+                raise ToolError(describe(not_found, args, kwargs))
+            except ReclaimError as e:
+                raise ToolError(f"Error {describe(action, args, kwargs)}: {e}")
+
+        return wrapper  # type: ignore
+
+    return decorator
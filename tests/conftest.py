@@ -1,7 +1,9 @@
 """Pytest fixtures for Reclaim MCP server tests."""
 
 import pytest
+from pytest import MonkeyPatch
 
+from reclaim_mcp import client as client_module
 from reclaim_mcp.cache import invalidate_cache
 from reclaim_mcp.config import Settings
 
@@ -14,6 +16,12 @@ def clear_cache():
     invalidate_cache()
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_client(monkeypatch: MonkeyPatch) -> None:
+    """Start each test without a shared ReclaimClient (pooled connections are bound to one event loop)."""
+    monkeypatch.setattr(client_module, "_shared_client", None)
+
+
 @pytest.fixture
 def settings() -> Settings:
     """Create test settings with a dummy API key."""
@@ -0,0 +1,118 @@
+"""Tests for analytics tools."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastmcp.exceptions import ToolError
+
+from reclaim_mcp.tools import analytics
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    """Create a mock ReclaimClient."""
+    client = MagicMock()
+    client.get = AsyncMock()
+    return client
+
+
+class TestGetUserAnalytics:
+    """Tests for get_user_analytics function."""
+
+    @pytest.mark.asyncio
+    async def test_get_user_analytics(self, mock_client: MagicMock) -> None:
+        """Test get_user_analytics sends the metric name and date range."""
+        mock_client.get.return_value = {"categories": []}
+
+        with patch.object(analytics, "_get_client", return_value=mock_client):
+            result = await analytics.get_user_analytics(
+                start="2026-01-01", end="2026-01-31", metric_name="DURATION_BY_CATEGORY"
+            )
+
+        assert result == {"categories": []}
+        mock_client.get.assert_called_once_with(
+            "/api/analytics/user/V3",
+            params={"start": "2026-01-01", "end": "2026-01-31", "metricName": "DURATION_BY_CATEGORY"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_user_analytics_invalid_metric(self, mock_client: MagicMock) -> None:
+        """Test get_user_analytics rejects unknown metrics before calling the API."""
+        with patch.object(analytics, "_get_client", return_value=mock_client):
+            with pytest.raises(ToolError):
+                await analytics.get_user_analytics(start="2026-01-01", end="2026-01-31", metric_name="BOGUS")
+
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(self, mock_client: MagicMock) -> None:
+        """Test concurrent cache misses for the same range trigger a single API request."""
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"categories": []}
+
+        mock_client.get.side_effect = slow_get
+
+        with patch.object(analytics, "_get_client", return_value=mock_client):
+            results = await asyncio.gather(
+                *(
+                    analytics.get_user_analytics(
+                        start="2026-01-01", end="2026-01-31", metric_name="DURATION_BY_CATEGORY"
+                    )
+                    for _ in range(5)
+                )
+            )
+
+        assert results == [{"categories": []}] * 5
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_user_analytics_multiple_metrics(self, mock_client: MagicMock) -> None:
+        """Test a metric list fetches every metric and keys results by metric name."""
+
+        async def get_by_metric(endpoint, params):
+            return {"metric": params["metricName"]}
+
+        mock_client.get.side_effect = get_by_metric
+
+        with patch.object(analytics, "_get_client", return_value=mock_client):
+            result = await analytics.get_user_analytics(
+                start="2026-02-01",
+                end="2026-02-28",
+                metric_name=["DURATION_BY_CATEGORY", "DURATION_BY_DATE_BY_CATEGORY"],
+            )
+
+        assert result == {
+            "DURATION_BY_CATEGORY": {"metric": "DURATION_BY_CATEGORY"},
+            "DURATION_BY_DATE_BY_CATEGORY": {"metric": "DURATION_BY_DATE_BY_CATEGORY"},
+        }
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_user_analytics_empty_metric_list(self, mock_client: MagicMock) -> None:
+        """Test an empty metric list is rejected before calling the API."""
+        with patch.object(analytics, "_get_client", return_value=mock_client):
+            with pytest.raises(ToolError):
+                await analytics.get_user_analytics(start="2026-01-01", end="2026-01-31", metric_name=[])
+
+        mock_client.get.assert_not_called()
+
+
+class TestGetFocusInsights:
+    """Tests for get_focus_insights function."""
+
+    @pytest.mark.asyncio
+    async def test_get_focus_insights(self, mock_client: MagicMock) -> None:
+        """Test get_focus_insights sends the date range."""
+        mock_client.get.return_value = {"protectedHours": 12}
+
+        with patch.object(analytics, "_get_client", return_value=mock_client):
+            result = await analytics.get_focus_insights(start="2026-01-01", end="2026-01-31")
+
+        assert result == {"protectedHours": 12}
+        mock_client.get.assert_called_once_with(
+            "/api/analytics/focus/insights/V3",
+            params={"start": "2026-01-01", "end": "2026-01-31"},
+        )
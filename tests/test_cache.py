@@ -1,8 +1,25 @@
 """Tests for the TTL cache utility."""
 
+import asyncio
+import time
+
 import pytest
 
-from reclaim_mcp.cache import get_cache_stats, invalidate_cache, ttl_cache
+from reclaim_mcp import cache
+from reclaim_mcp.cache import (
+    get_cache_stats,
+    invalidate_cache,
+    invalidate_entry,
+    prime_entry,
+    ttl_cache,
+    update_cached,
+)
+
+
+def _expire_all(seconds_ago: float = 1.0) -> None:
+    """Backdate every cache entry so it expired the given number of seconds ago."""
+    for key, (_, value) in list(cache._cache.items()):
+        cache._cache[key] = (time.monotonic() - seconds_ago, value)
 
 
 class TestTTLCache:
@@ -54,6 +71,22 @@ class TestTTLCache:
         await cached_function(1, 2)  # Same as first call
         assert call_count == 2  # Cache hit
 
+    @pytest.mark.asyncio
+    async def test_positional_keyword_and_default_calls_share_entry(self) -> None:
+        """Test equivalent calls hit the same entry however the arguments are passed."""
+        call_count = 0
+
+        @ttl_cache(ttl=60)
+        async def cached_function(x: int, y: int = 0) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x + y
+
+        await cached_function(1)
+        await cached_function(1, 0)
+        await cached_function(x=1, y=0)
+        assert call_count == 1
+
     @pytest.mark.asyncio
     async def test_error_strings_not_cached(self) -> None:
         """Test that error strings are not cached."""
@@ -87,6 +120,181 @@ class TestTTLCache:
         assert call_count == 3  # Cache hit
 
 
+class TestSingleFlight:
+    """Tests for coalescing concurrent cache misses."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self) -> None:
+        """Test that concurrent identical calls trigger a single underlying call."""
+        call_count = 0
+
+        @ttl_cache(ttl=60)
+        async def cached_function(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        results = await asyncio.gather(*(cached_function(5) for _ in range(5)))
+
+        assert results == [10] * 5
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_with_different_args_not_shared(self) -> None:
+        """Test that concurrent calls with different arguments run separately."""
+        call_count = 0
+
+        @ttl_cache(ttl=60)
+        async def cached_function(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        results = await asyncio.gather(cached_function(1), cached_function(2))
+
+        assert results == [2, 4]
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_callers(self) -> None:
+        """Test that a failed fetch raises for every waiter and is not cached."""
+        call_count = 0
+
+        @ttl_cache(ttl=60)
+        async def cached_function() -> str:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(cached_function(), cached_function(), return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert call_count == 1
+
+        with pytest.raises(ValueError):
+            await cached_function()
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_fetch_skips_caching(self) -> None:
+        """Test that a fetch invalidated mid-flight does not populate the cache."""
+        call_count = 0
+
+        @ttl_cache(ttl=60)
+        async def cached_function() -> int:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return call_count
+
+        first = asyncio.ensure_future(cached_function())
+        await asyncio.sleep(0)
+        invalidate_cache("cached_function")
+        assert await first == 1
+
+        # Stale in-flight result was not cached, so this refetches
+        assert await cached_function() == 2
+        assert call_count == 2
+
+
+class TestDynamicTTL:
+    """Tests for TTLs computed from the call's arguments."""
+
+    @pytest.mark.asyncio
+    async def test_callable_ttl_per_call(self) -> None:
+        """Test a callable ttl is evaluated with the decorated function's arguments."""
+
+        @ttl_cache(ttl=lambda days: days * 10)
+        async def cached_function(days: int) -> int:
+            return days
+
+        await cached_function(1)
+        await cached_function(days=30)
+
+        remaining = sorted(expires - time.monotonic() for expires, _ in cache._cache.values())
+        assert 0 < remaining[0] <= 10
+        assert 10 < remaining[1] <= 300
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving stale entries while refreshing in the background."""
+
+    @pytest.mark.asyncio
+    async def test_stale_value_returned_and_refreshed(self) -> None:
+        """Test that a recently expired entry is served while a refresh runs."""
+        call_count = 0
+
+        @ttl_cache(ttl=60, stale_ttl=60)
+        async def cached_function() -> int:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return call_count
+
+        assert await cached_function() == 1
+        _expire_all()
+
+        # Stale value comes back immediately; the refresh runs in the background
+        assert await cached_function() == 1
+        await asyncio.sleep(0.05)
+        assert call_count == 2
+        assert await cached_function() == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_past_stale_window_refetches(self) -> None:
+        """Test that an entry older than the stale window blocks on a fresh fetch."""
+        call_count = 0
+
+        @ttl_cache(ttl=60, stale_ttl=60)
+        async def cached_function() -> int:
+            nonlocal call_count
+            call_count += 1
+            return call_count
+
+        assert await cached_function() == 1
+        _expire_all(seconds_ago=120)
+
+        assert await cached_function() == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_disabled_by_default(self) -> None:
+        """Test that without stale_ttl an expired entry is refetched synchronously."""
+        call_count = 0
+
+        @ttl_cache(ttl=60)
+        async def cached_function() -> int:
+            nonlocal call_count
+            call_count += 1
+            return call_count
+
+        assert await cached_function() == 1
+        _expire_all()
+
+        assert await cached_function() == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_serving_stale(self) -> None:
+        """Test that a failing background refresh leaves the stale value in place."""
+        fail = False
+
+        @ttl_cache(ttl=60, stale_ttl=60)
+        async def cached_function() -> str:
+            if fail:
+                raise ValueError("boom")
+            return "ok"
+
+        assert await cached_function() == "ok"
+        _expire_all()
+        fail = True
+
+        assert await cached_function() == "ok"
+        await asyncio.sleep(0.01)
+        assert await cached_function() == "ok"
+
+
 class TestInvalidateCache:
     """Tests for invalidate_cache function."""
 
@@ -129,6 +337,70 @@ class TestInvalidateCache:
         assert call_count_a == 2
         assert call_count_b == 1
 
+    @pytest.mark.asyncio
+    async def test_invalidate_multiple_prefixes(self) -> None:
+        """Test invalidating several prefixes in one call leaves others cached."""
+        calls: list[str] = []
+
+        @ttl_cache(ttl=60)
+        async def func_a() -> str:
+            calls.append("a")
+            return "a"
+
+        @ttl_cache(ttl=60)
+        async def func_b() -> str:
+            calls.append("b")
+            return "b"
+
+        @ttl_cache(ttl=60)
+        async def func_c() -> str:
+            calls.append("c")
+            return "c"
+
+        for func in (func_a, func_b, func_c):
+            await func()
+
+        invalidate_cache("func_a", "func_b")
+
+        for func in (func_a, func_b, func_c):
+            await func()
+        assert calls == ["a", "b", "c", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_entry_keeps_other_calls(self) -> None:
+        """Test invalidating one call's entry leaves other arguments cached."""
+        calls: list[int] = []
+
+        @ttl_cache(ttl=60)
+        async def get_item(item_id: int) -> int:
+            calls.append(item_id)
+            return item_id
+
+        await get_item(1)
+        await get_item(2)
+        invalidate_entry(get_item, item_id=1)
+
+        await get_item(1)
+        await get_item(2)
+        assert calls == [1, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_prime_entry_serves_value_without_calling(self) -> None:
+        """Test a primed entry is returned on the next call and expires with the function's TTL."""
+        calls: list[int] = []
+
+        @ttl_cache(ttl=60)
+        async def get_item(item_id: int) -> str:
+            calls.append(item_id)
+            return f"fetched {item_id}"
+
+        prime_entry(get_item, "primed 1", 1)
+        assert await get_item(item_id=1) == "primed 1"
+        assert calls == []
+
+        _expire_all()
+        assert await get_item(1) == "fetched 1"
+
     @pytest.mark.asyncio
     async def test_invalidate_all(self) -> None:
         """Test invalidating entire cache."""
@@ -153,6 +425,46 @@ class TestInvalidateCache:
         assert call_count == 2
 
 
+class TestUpdateCached:
+    """Tests for update_cached function."""
+
+    @pytest.mark.asyncio
+    async def test_update_cached_rewrites_value(self) -> None:
+        """Test a write-through update is served without refetching."""
+        call_count = 0
+
+        @ttl_cache(ttl=60)
+        async def list_things() -> list[dict]:
+            nonlocal call_count
+            call_count += 1
+            return [{"id": 1, "name": "old"}, {"id": 2, "name": "other"}]
+
+        await list_things()
+        update_cached("list_things", lambda things: [{"id": 1, "name": "new"}, *things[1:]])
+
+        assert await list_things() == [{"id": 1, "name": "new"}, {"id": 2, "name": "other"}]
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_cached_detaches_inflight_fetch(self) -> None:
+        """Test a fetch started before the write does not overwrite the updated value."""
+        release = asyncio.Event()
+
+        @ttl_cache(ttl=60)
+        async def get_thing() -> str:
+            await release.wait()
+            return "stale"
+
+        pending = asyncio.create_task(get_thing())
+        await asyncio.sleep(0)
+        update_cached("get_thing", lambda value: "fresh")
+        release.set()
+        assert await pending == "stale"
+
+        # Nothing was cached by the detached fetch, so the next call fetches again
+        assert get_cache_stats()["total_entries"] == 0
+
+
 class TestCacheStats:
     """Tests for get_cache_stats function."""
 
@@ -1,9 +1,13 @@
 """Tests for the Reclaim.ai API client."""
 
+import asyncio
+import json
+
 import pytest
 from httpx import Request, Response
 from pytest import MonkeyPatch
 
+from reclaim_mcp import client as client_module
 from reclaim_mcp.client import ReclaimClient
 from reclaim_mcp.config import Settings
 
@@ -43,6 +47,21 @@ class TestReclaimClient:
         assert result == mock_tasks_list_response
         assert len(result) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_request_without_orjson(
+        self, settings: Settings, mock_tasks_list_response: list[dict], monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test responses are parsed with the standard library when orjson is missing."""
+
+        async def mock_get(*args, **kwargs):
+            return _make_response(200, mock_tasks_list_response)
+
+        monkeypatch.setattr("httpx.AsyncClient.get", mock_get)
+        monkeypatch.setattr(client_module, "orjson", None)
+
+        client = ReclaimClient(settings)
+        assert await client.get("/api/tasks") == mock_tasks_list_response
+
     @pytest.mark.asyncio
     async def test_post_request(self, settings: Settings, mock_task_response: dict, monkeypatch: MonkeyPatch) -> None:
         """Test POST request returns parsed JSON."""
@@ -58,6 +77,24 @@ class TestReclaimClient:
         assert result["id"] == 12345
         assert result["title"] == "Test Task"
 
+    @pytest.mark.asyncio
+    async def test_post_sends_json_body(self, settings: Settings, monkeypatch: MonkeyPatch) -> None:
+        """Test POST encodes the body as compact JSON bytes."""
+        captured: dict = {}
+
+        async def mock_post(*args, **kwargs):
+            captured.update(kwargs)
+            return _make_response(200, {})
+
+        monkeypatch.setattr("httpx.AsyncClient.post", mock_post)
+
+        client = ReclaimClient(settings)
+        await client.post("/api/planner/event/rsvp/1/abc", {"responseStatus": "Accepted", "title": "Café"})
+
+        assert isinstance(captured["content"], bytes)
+        assert json.loads(captured["content"]) == {"responseStatus": "Accepted", "title": "Café"}
+        assert b" " not in captured["content"]
+
     @pytest.mark.asyncio
     async def test_delete_request_success(self, settings: Settings, monkeypatch: MonkeyPatch) -> None:
         """Test DELETE request returns True on success."""
@@ -102,6 +139,65 @@ class TestReclaimClient:
             await client.get("/api/tasks")
 
         assert "30s" in str(exc_info.value)
+        assert exc_info.value.retry_after == 30
+
+    @pytest.mark.asyncio
+    async def test_get_request_rate_limit_without_retry_after(
+        self, settings: Settings, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test a 429 without Retry-After reports no server hint."""
+        from reclaim_mcp.exceptions import RateLimitError
+
+        async def mock_get(*args, **kwargs):
+            return Response(429, request=Request("GET", "https://test.example.com"))
+
+        monkeypatch.setattr("httpx.AsyncClient.get", mock_get)
+        monkeypatch.setattr(ReclaimClient, "RATE_LIMIT_BACKOFF", 0.0)
+
+        client = ReclaimClient(settings)
+        with pytest.raises(RateLimitError) as exc_info:
+            await client.get("/api/tasks")
+
+        assert "60s" in str(exc_info.value)
+        assert exc_info.value.retry_after is None
+
+    @pytest.mark.asyncio
+    async def test_get_request_retries_short_rate_limit(self, settings: Settings, monkeypatch: MonkeyPatch) -> None:
+        """Test a 429 with a short Retry-After is retried instead of raised."""
+        responses = [
+            Response(429, headers={"Retry-After": "0"}, request=Request("GET", "https://test.example.com")),
+            _make_response(200, []),
+        ]
+
+        async def mock_get(*args, **kwargs):
+            return responses.pop(0)
+
+        monkeypatch.setattr("httpx.AsyncClient.get", mock_get)
+
+        client = ReclaimClient(settings)
+        assert await client.get("/api/tasks") == []
+        assert responses == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_are_bounded(self, settings: Settings, monkeypatch: MonkeyPatch) -> None:
+        """Test repeated 429s without Retry-After are raised after RATE_LIMIT_RETRIES retries."""
+        from reclaim_mcp.exceptions import RateLimitError
+
+        calls = 0
+
+        async def mock_post(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return Response(429, request=Request("POST", "https://test.example.com"))
+
+        monkeypatch.setattr("httpx.AsyncClient.post", mock_post)
+        monkeypatch.setattr(ReclaimClient, "RATE_LIMIT_BACKOFF", 0.0)
+
+        client = ReclaimClient(settings)
+        with pytest.raises(RateLimitError):
+            await client.post("/api/tasks", data={"title": "Test"})
+
+        assert calls == ReclaimClient.RATE_LIMIT_RETRIES + 1
 
     @pytest.mark.asyncio
     async def test_get_request_not_found(self, settings: Settings, monkeypatch: MonkeyPatch) -> None:
@@ -151,3 +247,65 @@ class TestReclaimClient:
             await client.get("/api/tasks")
 
         assert "server error (500)" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_client_reuses_connection_pool(self, settings: Settings, monkeypatch: MonkeyPatch) -> None:
+        """Test that every request goes through the same httpx client."""
+        seen: list[object] = []
+
+        async def mock_get(self, *args, **kwargs):
+            seen.append(self)
+            return _make_response(200, [])
+
+        monkeypatch.setattr("httpx.AsyncClient.get", mock_get)
+
+        client = ReclaimClient(settings)
+        await client.get("/api/tasks")
+        await client.get("/api/tasks")
+        await client.aclose()
+
+        assert seen == [client._http, client._http]
+        assert client._http.is_closed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_bounded(self, settings: Settings, monkeypatch: MonkeyPatch) -> None:
+        """Test that no more than MAX_CONCURRENT_REQUESTS run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_response(200, [])
+
+        monkeypatch.setattr("httpx.AsyncClient.get", mock_get)
+        monkeypatch.setattr(ReclaimClient, "MAX_CONCURRENT_REQUESTS", 2)
+
+        client = ReclaimClient(settings)
+        await asyncio.gather(*(client.get("/api/tasks") for _ in range(6)))
+
+        assert peak == 2
+
+
+class TestSharedClient:
+    """Tests for the process-wide shared client."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_returns_same_instance(self, monkeypatch: MonkeyPatch) -> None:
+        """Test get_client reuses one client until close_client is called."""
+        from reclaim_mcp.client import close_client, get_client
+
+        monkeypatch.setenv("RECLAIM_API_KEY", "test_api_key_12345")
+        await close_client()
+
+        first = get_client()
+        assert get_client() is first
+
+        await close_client()
+        assert first._http.is_closed
+        second = get_client()
+        assert second is not first
+        await close_client()
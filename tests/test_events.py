@@ -1,9 +1,15 @@
 """Tests for calendar and event tools."""
 
+import time
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from fastmcp.exceptions import ToolError
 
+from reclaim_mcp import cache
+from reclaim_mcp.exceptions import NotFoundError
 from reclaim_mcp.tools import events
 from reclaim_mcp.tools.events import _extract_date
 
@@ -93,6 +99,20 @@ class TestListEvents:
         assert call_args[1]["params"]["type"] == "EXTERNAL"
         assert call_args[1]["params"]["thin"] is False
 
+    @pytest.mark.asyncio
+    async def test_list_events_past_range_cached_longer(self, mock_client: MagicMock) -> None:
+        """Test event lists ending before today get the long TTL, current ones the short one."""
+        mock_client.get.return_value = []
+        today = date.today().isoformat()
+
+        with patch.object(events, "_get_client", return_value=mock_client):
+            await events.list_events(start="2020-01-01", end="2020-01-31")
+            await events.list_events(start=today, end=today)
+
+        remaining = sorted(expires - time.monotonic() for expires, _ in cache._cache.values())
+        assert remaining[0] <= 60
+        assert remaining[1] > 60
+
 
 class TestListPersonalEvents:
     """Tests for list_personal_events function."""
@@ -118,6 +138,7 @@ class TestListPersonalEvents:
         assert params["limit"] == 50
         assert "start" in params  # Now defaults to today
         assert "end" in params  # Now defaults to today + 7 days
+        assert (date.fromisoformat(params["end"]) - date.fromisoformat(params["start"])).days == 7
 
     @pytest.mark.asyncio
     async def test_list_personal_events_with_date_range(self, mock_client: MagicMock) -> None:
@@ -177,3 +198,65 @@ class TestGetEvent:
             "/api/events/1/abc123xyz",
             params={"thin": True},
         )
+
+
+class TestGetEventsBulk:
+    """Tests for get_events_bulk function."""
+
+    @pytest.mark.asyncio
+    async def test_get_events_bulk(self, mock_client: MagicMock) -> None:
+        """Test get_events_bulk returns one result per pair, in order."""
+
+        async def get_by_path(endpoint, params):
+            return {"eventId": endpoint.rsplit("/", 1)[-1]}
+
+        mock_client.get.side_effect = get_by_path
+
+        with patch.object(events, "_get_client", return_value=mock_client):
+            result = await events.get_events_bulk(events=[(1, "a"), (2, "b"), (1, "c")])
+
+        assert result == [{"eventId": "a"}, {"eventId": "b"}, {"eventId": "c"}]
+        assert mock_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_events_bulk_partial_failure(self, mock_client: MagicMock) -> None:
+        """Test a missing event is reported in place without failing the others."""
+
+        async def get_by_path(endpoint, params):
+            if endpoint.endswith("/missing"):
+                raise NotFoundError(f"Resource not found: {endpoint}")
+            return {"eventId": endpoint.rsplit("/", 1)[-1]}
+
+        mock_client.get.side_effect = get_by_path
+
+        with patch.object(events, "_get_client", return_value=mock_client):
+            result = await events.get_events_bulk(events=[(1, "a"), (1, "missing")])
+
+        assert result[0] == {"eventId": "a"}
+        assert result[1] == {"calendarId": 1, "eventId": "missing", "error": "Event missing not found in calendar 1"}
+
+    @pytest.mark.asyncio
+    async def test_get_events_bulk_transport_error(self, mock_client: MagicMock) -> None:
+        """Test a lookup failing with a non-Reclaim error is reported in place without failing the others."""
+
+        async def get_by_path(endpoint, params):
+            if endpoint.endswith("/slow"):
+                raise httpx.ReadTimeout("timed out")
+            return {"eventId": endpoint.rsplit("/", 1)[-1]}
+
+        mock_client.get.side_effect = get_by_path
+
+        with patch.object(events, "_get_client", return_value=mock_client):
+            result = await events.get_events_bulk(events=[(1, "slow"), (1, "b")])
+
+        assert result[0] == {"calendarId": 1, "eventId": "slow", "error": "ReadTimeout: timed out"}
+        assert result[1] == {"eventId": "b"}
+
+    @pytest.mark.asyncio
+    async def test_get_events_bulk_empty(self, mock_client: MagicMock) -> None:
+        """Test an empty pair list is rejected before calling the API."""
+        with patch.object(events, "_get_client", return_value=mock_client):
+            with pytest.raises(ToolError):
+                await events.get_events_bulk(events=[])
+
+        mock_client.get.assert_not_called()
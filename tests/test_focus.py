@@ -0,0 +1,64 @@
+"""Tests for focus time tools."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastmcp.exceptions import ToolError
+
+from reclaim_mcp.exceptions import NotFoundError
+from reclaim_mcp.tools import focus
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    """Create a mock ReclaimClient."""
+    client = MagicMock()
+    client.get = AsyncMock()
+    client.patch = AsyncMock()
+    return client
+
+
+class TestUpdateFocusSettings:
+    """Tests for update_focus_settings function."""
+
+    @pytest.mark.asyncio
+    async def test_update_writes_through_to_cached_settings(self, mock_client: MagicMock) -> None:
+        """Test the PATCH response replaces the cached entry instead of forcing a refetch."""
+        mock_client.get.return_value = [{"id": 1, "enabled": True}, {"id": 2, "enabled": True}]
+        mock_client.patch.return_value = {"id": 1, "enabled": False}
+
+        with patch.object(focus, "_get_client", return_value=mock_client):
+            await focus.get_focus_settings()
+            result = await focus.update_focus_settings(settings_id=1, enabled=False)
+            cached = await focus.get_focus_settings()
+
+        assert result == {"id": 1, "enabled": False}
+        assert cached == [{"id": 1, "enabled": False}, {"id": 2, "enabled": True}]
+        mock_client.patch.assert_called_once_with("/api/focus-settings/user/1", {"enabled": False})
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_without_settings_body_invalidates(self, mock_client: MagicMock) -> None:
+        """Test an empty PATCH response falls back to invalidating the cached settings."""
+        mock_client.get.return_value = [{"id": 1, "enabled": True}]
+        mock_client.patch.return_value = {}
+
+        with patch.object(focus, "_get_client", return_value=mock_client):
+            await focus.get_focus_settings()
+            await focus.update_focus_settings(settings_id=1, enabled=False)
+            await focus.get_focus_settings()
+
+        assert mock_client.get.call_count == 2
+
+
+class TestLockFocusBlock:
+    """Tests for lock_focus_block function."""
+
+    @pytest.mark.asyncio
+    async def test_lock_focus_block_not_found(self, mock_client: MagicMock) -> None:
+        """Test a 404 is reported with the focus block and calendar IDs."""
+        mock_client.post = AsyncMock(side_effect=NotFoundError("Resource not found"))
+
+        with patch.object(focus, "_get_client", return_value=mock_client):
+            with pytest.raises(ToolError, match="^Focus block abc not found in calendar 7$"):
+                await focus.lock_focus_block(calendar_id=7, event_id="abc")
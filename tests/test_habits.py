@@ -1,9 +1,13 @@
 """Tests for smart habit tools."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from fastmcp.exceptions import ToolError
 
+from reclaim_mcp.exceptions import NotFoundError
 from reclaim_mcp.tools import habits
 
 
@@ -42,6 +46,58 @@ class TestListHabits:
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_list_habits_warms_get_habit(
+        self, mock_client: MagicMock, mock_habits_list_response: list[dict]
+    ) -> None:
+        """Test get_habit for a habit from list_habits is served without another request."""
+        mock_client.get.return_value = mock_habits_list_response
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            await habits.list_habits()
+            result = await habits.get_habit(lineage_id=12345)
+
+        assert result == mock_habits_list_response[0]
+        mock_client.get.assert_called_once_with("/api/smart-habits")
+
+    @pytest.mark.asyncio
+    async def test_list_fetch_invalidated_mid_flight_does_not_warm_get_habit(self, mock_client: MagicMock) -> None:
+        """Test a list_habits fetch overtaken by update_habit does not cache the old habit for get_habit."""
+        list_started = asyncio.Event()
+        release_list = asyncio.Event()
+
+        async def get(endpoint):
+            if endpoint == "/api/smart-habits":
+                list_started.set()
+                await release_list.wait()
+                return [{"lineageId": 1, "title": "old"}]
+            return {"lineageId": 1, "title": "new"}
+
+        mock_client.get.side_effect = get
+        mock_client.patch.return_value = {"lineageId": 1, "title": "new"}
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            listing = asyncio.ensure_future(habits.list_habits())
+            await list_started.wait()
+            await habits.update_habit(lineage_id=1, title="new")
+            release_list.set()
+            await listing
+
+            result = await habits.get_habit(lineage_id=1)
+
+        assert result == {"lineageId": 1, "title": "new"}
+
+    def test_habits_ttl_adapts_to_mutations(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the habit read TTL is short after a habit mutation and grows while habits are unchanged."""
+        monkeypatch.setattr(habits, "_last_habit_mutation", habits.time.monotonic() - 3600)
+        assert habits._habits_ttl() == habits._HABITS_MAX_TTL
+
+        habits._invalidate_habit_caches()
+        assert habits._habits_ttl() == habits._HABITS_MIN_TTL
+
+        monkeypatch.setattr(habits, "_last_habit_mutation", habits.time.monotonic() - 90)
+        assert habits._habits_ttl() == 90
+
 
 class TestGetHabit:
     """Tests for get_habit function."""
@@ -373,3 +429,165 @@ class TestConvertEventToHabit:
         assert payload["description"] == "Weekly team standup"
         assert payload["recurrence"]["frequency"] == "WEEKLY"
         assert payload["recurrence"]["idealDays"] == ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"]
+
+
+class TestHabitCacheInvalidation:
+    """Tests for cache invalidation after habit mutations."""
+
+    @pytest.mark.asyncio
+    async def test_instance_mutation_clears_habit_event_and_moment_caches(self, mock_client: MagicMock) -> None:
+        """Test marking a habit instance done drops cached habit, calendar and moment reads."""
+        from reclaim_mcp import cache
+        from reclaim_mcp.tools import events, moments, tasks
+
+        tasks_key = tasks.list_tasks.cache_key()
+        keys = (
+            habits.list_habits.cache_key(),
+            events.list_events.cache_key("2026-01-05", "2026-01-09"),
+            moments.get_next_moment.cache_key(),
+            tasks_key,
+        )
+        for key in keys:
+            cache._cache[key] = (float("inf"), [])
+        mock_client.post.return_value = {"events": [], "series": []}
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            await habits.mark_habit_done(event_id="abc123")
+
+        assert set(cache._cache) == {tasks_key}
+
+    @pytest.mark.asyncio
+    async def test_series_mutation_keeps_other_habits_cached(self, mock_client: MagicMock) -> None:
+        """Test enabling one habit drops only that habit's get_habit entry."""
+        mock_client.get.side_effect = lambda endpoint: {"id": int(endpoint.rsplit("/", 1)[-1])}
+        mock_client.post.return_value = {"id": 1, "enabled": True}
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            await habits.get_habit(lineage_id=1)
+            await habits.get_habit(lineage_id=2)
+            await habits.enable_habit(lineage_id=1)
+            await habits.get_habit(lineage_id=1)
+            await habits.get_habit(lineage_id=2)
+
+        fetched = [call.args[0] for call in mock_client.get.call_args_list]
+        assert fetched == ["/api/smart-habits/1", "/api/smart-habits/2", "/api/smart-habits/1"]
+
+    @pytest.mark.asyncio
+    async def test_create_keeps_existing_habits_cached(self, mock_client: MagicMock) -> None:
+        """Test creating a habit leaves cached get_habit entries of other habits in place."""
+        mock_client.get.side_effect = lambda endpoint: {"lineageId": int(endpoint.rsplit("/", 1)[-1])}
+        mock_client.post.return_value = {"lineageId": 3}
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            await habits.get_habit(lineage_id=1)
+            await habits.create_habit(title="Write", ideal_time="09:00", duration_min_mins=15)
+            await habits.get_habit(lineage_id=1)
+
+        mock_client.get.assert_called_once_with("/api/smart-habits/1")
+
+    @pytest.mark.asyncio
+    async def test_habit_mutations_update_cached_list(self, mock_client: MagicMock) -> None:
+        """Test create, update and delete rewrite the cached habit list instead of refetching it."""
+        mock_client.get.return_value = [{"lineageId": 1, "title": "Read"}, {"lineageId": 2, "title": "Run"}]
+        mock_client.post.return_value = {"lineageId": 3, "title": "Write"}
+        mock_client.patch.return_value = {"lineageId": 1, "title": "Read more"}
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            await habits.list_habits()
+            await habits.create_habit(title="Write", ideal_time="09:00", duration_min_mins=15)
+            await habits.update_habit(lineage_id=1, title="Read more")
+            await habits.delete_habit(lineage_id=2)
+            result = await habits.list_habits()
+
+        assert result == [{"lineageId": 1, "title": "Read more"}, {"lineageId": 3, "title": "Write"}]
+        mock_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unrecognized_mutation_response_invalidates_list(self, mock_client: MagicMock) -> None:
+        """Test a response without a lineageId falls back to refetching the habit list."""
+        mock_client.get.return_value = [{"lineageId": 1}]
+        mock_client.post.return_value = {}
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            await habits.list_habits()
+            await habits.create_habit(title="Write", ideal_time="09:00", duration_min_mins=15)
+            await habits.list_habits()
+
+        assert mock_client.get.call_count == 2
+
+
+class TestBatchHabits:
+    """Tests for batch_habits function."""
+
+    @pytest.mark.asyncio
+    async def test_batch_habits(self, mock_client: MagicMock) -> None:
+        """Test each operation is dispatched to its endpoint and reported in order."""
+        mock_client.post.return_value = {"events": []}
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            result = await habits.batch_habits(
+                operations=[
+                    {"action": "mark_done", "event_id": "evt1"},
+                    {"action": "start", "lineage_id": 42},
+                ]
+            )
+
+        assert result == [
+            {"index": 0, "action": "mark_done", "status": "ok", "result": {"events": []}},
+            {"index": 1, "action": "start", "status": "ok", "result": {"events": []}},
+        ]
+        posted = {call.args[0] for call in mock_client.post.call_args_list}
+        assert posted == {"/api/smart-habits/planner/evt1/done", "/api/smart-habits/planner/42/start"}
+
+    @pytest.mark.asyncio
+    async def test_batch_habits_partial_failure(self, mock_client: MagicMock) -> None:
+        """Test a failing operation is reported without failing the rest."""
+
+        async def post(endpoint, data):
+            if "missing" in endpoint:
+                raise NotFoundError(f"Resource not found: {endpoint}")
+            return {"events": []}
+
+        mock_client.post.side_effect = post
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            result = await habits.batch_habits(
+                operations=[
+                    {"action": "skip", "event_id": "missing"},
+                    {"action": "skip", "event_id": "evt2"},
+                ]
+            )
+
+        assert result[0] == {"index": 0, "action": "skip", "status": "error", "error": "Habit event missing not found"}
+        assert result[1]["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_batch_habits_transport_error(self, mock_client: MagicMock) -> None:
+        """Test an operation failing with a non-Reclaim error is reported without failing the rest."""
+
+        async def post(endpoint, data):
+            if "slow" in endpoint:
+                raise httpx.ReadTimeout("timed out")
+            return {"events": []}
+
+        mock_client.post.side_effect = post
+
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            result = await habits.batch_habits(
+                operations=[
+                    {"action": "mark_done", "event_id": "slow"},
+                    {"action": "mark_done", "event_id": "evt2"},
+                ]
+            )
+
+        assert result[0] == {"index": 0, "action": "mark_done", "status": "error", "error": "ReadTimeout: timed out"}
+        assert result[1]["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_batch_habits_requires_matching_id(self, mock_client: MagicMock) -> None:
+        """Test an operation without the ID its action needs is rejected up front."""
+        with patch.object(habits, "_get_client", return_value=mock_client):
+            with pytest.raises(ToolError, match="enable requires lineage_id"):
+                await habits.batch_habits(operations=[{"action": "enable", "event_id": "evt1"}])
+
+        mock_client.post.assert_not_called()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from reclaim_mcp.models import FocusSettingsUpdate, Task, TaskCreate, TaskStatus, TaskUpdate
+from reclaim_mcp.models import FocusSettingsUpdate, HabitUpdate, Task, TaskCreate, TaskStatus, TaskUpdate
 
 
 class TestTaskModel:
@@ -99,6 +99,26 @@ class TestTaskUpdateModel:
         with pytest.raises(ValueError):
             TaskUpdate(min_chunk_size_minutes=0)
 
+    def test_task_update_dumps_api_field_names(self) -> None:
+        """Test TaskUpdate dumps only set fields, keyed by Reclaim API names."""
+        update = TaskUpdate(priority="P1", snooze_until="2026-01-10T09:00:00Z", max_chunk_size_minutes=60)
+        assert update.model_dump(mode="json", by_alias=True, exclude_none=True) == {
+            "priority": "P1",
+            "snoozeUntil": "2026-01-10T09:00:00Z",
+            "maxChunkSize": 60,
+        }
+
+
+class TestHabitUpdateModel:
+    """Tests for HabitUpdate model validation."""
+
+    def test_habit_update_normalizes_ideal_time(self) -> None:
+        """Test HH:MM times are normalized to HH:MM:SS and dumped under the API field name."""
+        assert HabitUpdate(ideal_time="08:30").model_dump(mode="json", by_alias=True, exclude_none=True) == {
+            "idealTime": "08:30:00"
+        }
+        assert HabitUpdate(ideal_time="08:30:15").ideal_time == "08:30:15"
+
 
 class TestFocusSettingsUpdate:
     """Tests for FocusSettingsUpdate model validation."""
@@ -119,3 +139,11 @@ class TestFocusSettingsUpdate:
         assert settings.min_duration_mins == 15
         assert settings.ideal_duration_mins == 30
         assert settings.max_duration_mins == 60
+
+    def test_focus_settings_update_dumps_api_field_names(self) -> None:
+        """Test FocusSettingsUpdate dumps only set fields, keyed by Reclaim API names."""
+        settings = FocusSettingsUpdate(ideal_duration_mins=45, defense_aggression="HIGH")
+        assert settings.model_dump(mode="json", by_alias=True, exclude_none=True) == {
+            "idealDurationMins": 45,
+            "defenseAggression": "HIGH",
+        }
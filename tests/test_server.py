@@ -1,8 +1,76 @@
 """Tests for the MCP server."""
 
-from reclaim_mcp import __version__
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from reclaim_mcp import __version__, server
 
 
 def test_version() -> None:
     """Test that version is defined."""
     assert __version__ == "0.11.0"
+
+
+class TestToolCallLogger:
+    """Tests for the tool-call logging middleware."""
+
+    @pytest.mark.asyncio
+    async def test_logs_then_calls_next(self) -> None:
+        """Test that the middleware logs the tool call and forwards it."""
+        context = MagicMock()
+        context.fastmcp_context.info = AsyncMock()
+        context.message.name = "get_task"
+        context.message.arguments = {"task_id": 42}
+        call_next = AsyncMock(return_value="result")
+
+        result = await server.ToolCallLogger().on_call_tool(context, call_next)
+
+        assert result == "result"
+        context.fastmcp_context.info.assert_awaited_once_with("Calling get_task: {'task_id': 42}")
+        call_next.assert_awaited_once_with(context)
+
+    @pytest.mark.asyncio
+    async def test_health_check_not_logged(self) -> None:
+        """Test that health_check probes skip the progress log."""
+        context = MagicMock()
+        context.fastmcp_context.info = AsyncMock()
+        context.message.name = "health_check"
+        call_next = AsyncMock(return_value="result")
+
+        await server.ToolCallLogger().on_call_tool(context, call_next)
+
+        context.fastmcp_context.info.assert_not_awaited()
+        call_next.assert_awaited_once_with(context)
+
+    @pytest.mark.asyncio
+    async def test_tools_registered_directly(self) -> None:
+        """Test that downstream tool functions are registered without wrappers."""
+        from reclaim_mcp.tools import tasks
+
+        tool = await server.mcp.get_tool("get_task")
+        assert tool.fn is tasks.get_task
+
+
+class TestToolTable:
+    """Tests for the declarative tool registration table."""
+
+    def test_table_covers_all_profile_tools(self) -> None:
+        """Test that every tool known to the profiles is registered by name."""
+        from reclaim_mcp.profiles import get_enabled_tools
+
+        names = {fn.__name__ for fn in server._TOOLS} | {"health_check", "verify_connection"}
+        assert names == get_enabled_tools("full")
+        assert len(server._TOOLS) == len({fn.__name__ for fn in server._TOOLS})
+
+
+def test_orjson_serializer_matches_default() -> None:
+    """Test the orjson tool serializer produces the same JSON as FastMCP's default."""
+    pytest.importorskip("orjson")
+    from datetime import datetime
+
+    from fastmcp.tools.tool import default_serializer
+
+    data = [{"id": 1, "title": "Task", "due": None, "at": datetime(2026, 1, 2, 9, 30)}]
+    assert json.loads(server._orjson_serializer(data)) == json.loads(default_serializer(data))
@@ -514,3 +514,29 @@ class TestPlanWork:
 
         with pytest.raises(ToolError):
             await tasks.plan_work(task_id=12345, date_time="not-a-date", duration_minutes=60)
+
+
+class TestTaskCacheInvalidation:
+    """Tests for cache invalidation after task mutations."""
+
+    @pytest.mark.asyncio
+    async def test_mutation_clears_task_event_and_moment_caches(self, mock_client: MagicMock) -> None:
+        """Test a task mutation drops cached task, calendar and moment reads."""
+        from reclaim_mcp import cache
+        from reclaim_mcp.tools import events, habits, moments
+
+        habits_key = habits.list_habits.cache_key()
+        keys = (
+            tasks.list_tasks.cache_key(),
+            events.list_personal_events.cache_key(),
+            moments.get_current_moment.cache_key(),
+            habits_key,
+        )
+        for key in keys:
+            cache._cache[key] = (float("inf"), [])
+        mock_client.post.return_value = {"taskOrHabit": {"id": 12345}}
+
+        with patch.object(tasks, "_get_client", return_value=mock_client):
+            await tasks.snooze_task(task_id=12345, snooze_option="TOMORROW")
+
+        assert set(cache._cache) == {habits_key}
@@ -0,0 +1,93 @@
+"""Tests for shared tool utilities."""
+
+import pytest
+from fastmcp.exceptions import ToolError
+from pydantic import BaseModel, Field
+
+from reclaim_mcp.exceptions import APIError, NotFoundError, RateLimitError
+from reclaim_mcp.utils import reclaim_errors
+
+
+class _Limit(BaseModel):
+    limit: int = Field(gt=0)
+
+
+class TestReclaimErrors:
+    """Tests for the reclaim_errors decorator."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self) -> None:
+        """Test the wrapped tool's result passes through unchanged."""
+
+        @reclaim_errors("getting thing {thing_id}")
+        async def get_thing(thing_id: str) -> dict:
+            return {"id": thing_id}
+
+        assert await get_thing("abc") == {"id": "abc"}
+
+    @pytest.mark.asyncio
+    async def test_validation_error(self) -> None:
+        """Test Pydantic validation errors become readable ToolErrors."""
+
+        @reclaim_errors("listing things")
+        async def list_things(limit: int = 0) -> list:
+            _Limit(limit=limit)
+            return []
+
+        with pytest.raises(ToolError, match="^Invalid input: "):
+            await list_things()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error(self) -> None:
+        """Test rate limit errors are passed through verbatim."""
+
+        @reclaim_errors("listing things")
+        async def list_things() -> list:
+            raise RateLimitError("Rate limit exceeded. Wait 60s before retrying.")
+
+        with pytest.raises(ToolError, match="^Rate limit exceeded. Wait 60s before retrying.$"):
+            await list_things()
+
+    @pytest.mark.asyncio
+    async def test_not_found_message(self) -> None:
+        """Test the not_found message is formatted with the tool's arguments, including defaults."""
+
+        @reclaim_errors("getting thing {thing_id}", not_found="Thing {thing_id} not found in {where}")
+        async def get_thing(thing_id: str, where: str = "calendar") -> dict:
+            raise NotFoundError("Resource not found: /api/things")
+
+        with pytest.raises(ToolError, match="^Thing abc not found in calendar$"):
+            await get_thing("abc")
+
+    @pytest.mark.asyncio
+    async def test_not_found_without_message(self) -> None:
+        """Test a 404 falls back to the generic error message when no not_found is given."""
+
+        @reclaim_errors("getting thing {thing_id}")
+        async def get_thing(thing_id: str) -> dict:
+            raise NotFoundError("Resource not found: /api/things/abc")
+
+        with pytest.raises(ToolError, match="^Error getting thing abc: Resource not found"):
+            await get_thing(thing_id="abc")
+
+    @pytest.mark.asyncio
+    async def test_api_error(self) -> None:
+        """Test other Reclaim errors are prefixed with the action."""
+
+        @reclaim_errors("moving thing {thing_id}")
+        async def move_thing(thing_id: str) -> dict:
+            raise APIError("API error 400: bad")
+
+        with pytest.raises(ToolError, match="^Error moving thing xyz: API error 400: bad$"):
+            await move_thing("xyz")
+
+    @pytest.mark.asyncio
+    async def test_unrelated_errors_propagate(self) -> None:
+        """Test exceptions outside the Reclaim hierarchy are not swallowed."""
+
+        @reclaim_errors("doing things")
+        async def do_things() -> None:
+            raise KeyError("boom")
+
+        with pytest.raises(KeyError):
+            await do_things()